@@ -0,0 +1,51 @@
+"""
+Optional Numba kernel for the frame-difference step of motion detection.
+
+Numba is not a required dependency. When it is not installed,
+diff_threshold is None and MotionDetector falls back to the OpenCV
+absdiff/threshold chain.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _diff_threshold_row(prev, curr, thresh, out):
+        """Threshold the difference of one row and return its motion pixel count."""
+        count = 0
+        for x in range(prev.shape[0]):
+            a = np.int16(prev[x])
+            b = np.int16(curr[x])
+            d = a - b if a > b else b - a
+            if d > thresh:
+                out[x] = 255
+                count += 1
+            else:
+                out[x] = 0
+        return count
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def diff_threshold(prev, curr, thresh, out):
+        """
+        Fused absdiff + binary threshold + non-zero count, parallel over rows.
+
+        Args:
+            prev: Previous grayscale frame (uint8, 2-D)
+            curr: Current grayscale frame (uint8, same shape as prev)
+            thresh: Pixels whose difference exceeds this value are motion
+            out: Output mask (uint8, same shape), set to 255 or 0
+
+        Returns:
+            Number of motion pixels in out
+        """
+        count = 0
+        for y in prange(prev.shape[0]):
+            count += _diff_threshold_row(prev[y], curr[y], thresh, out[y])
+        return count
+else:
+    diff_threshold = None
@@ -11,12 +11,21 @@ OUTPUT_FOLDER = os.path.join(os.getcwd(), "output_clips")
 MOTION_THRESHOLD = 25  # Threshold for pixel difference to be considered motion
 MIN_CONTOUR_AREA = 500  # Minimum area of contour to be considered motion
 MOTION_SENSITIVITY = 0.01  # Percentage of ROI area that needs to change to trigger detection
+DETECTION_SCALE = 0.5  # Frames are downscaled by this factor before motion detection
+TILE_GATE_BLOCK = 0  # Tile size (on the 8x-decimated ROI) of the static-frame gate, e.g. 20 (0 = off)
+TILE_GATE_MIN_SUM = 200  # Summed tile difference that runs full detection (~ threshold x min area / 64)
 
 # Video export settings
 PADDING_BEFORE_SECONDS = 2  # Seconds of video to include before motion
 PADDING_AFTER_SECONDS = 2  # Seconds of video to include after motion
 MIN_CLIP_DURATION_SECONDS = 2  # Minimum duration for exported clips
 MERGE_GAP_SECONDS = 10  # Gap threshold to merge motion segments (throttle)
+SEEK_GRAB_FRAMES = 250  # Clip starts up to this many frames in are reached by grabbing instead of seeking
+EXPORT_FRAME_BUFFERS = 16  # Frames decoded ahead of the writer when re-encoding with OpenCV
+FFMPEG_PATH = "ffmpeg"  # ffmpeg used for stream-copy export and ROI-cropped analysis decoding ("" = OpenCV only)
+FFPROBE_PATH = "ffprobe"  # ffprobe used to read video metadata without decoding ("" = use OpenCV)
+EXPORT_HW_ACCEL = "auto"  # GPU (NVENC) re-encode when stream copy fails: "auto", "cuda" or None
+FREE_SPACE_MARGIN = 1.5  # Free disk space required per clip, as a multiple of its estimated size (0 = no check)
 
 # GUI settings
 PREVIEW_WIDTH = 800
@@ -24,3 +33,6 @@ PREVIEW_HEIGHT = 600
 
 # Processing settings
 FRAME_SKIP = 2  # Process every Nth frame for faster processing (1 = process all frames)
+HW_ACCELERATION = True  # Use hardware video decoding for analysis when available
+PROGRESS_INTERVAL_SECONDS = 0.1  # Minimum time between analysis and export progress updates
+USE_OPENCL = False  # Run the motion detection pipeline on OpenCL (cv2.UMat) when available
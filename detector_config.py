@@ -0,0 +1,46 @@
+"""
+Effective motion detection settings for a processing run.
+"""
+from dataclasses import dataclass
+import config
+
+
+@dataclass(frozen=True, slots=True)
+class DetectorConfig:
+    """Immutable motion detection settings, resolved once per run."""
+
+    threshold: int  # Threshold for pixel difference to be considered motion
+    min_contour_area: int  # Minimum area of a motion blob, in full-resolution pixels
+    sensitivity: float  # Fraction of ROI area that needs to change
+    scale: float  # Downscale factor applied before detection (1.0 = full resolution)
+    frame_skip: int  # Analyze every Nth frame
+    use_opencl: bool  # Run the pipeline on OpenCL (cv2.UMat) when available
+    hw_acceleration: bool  # Use hardware video decoding when available
+    tile_gate_block: int  # Tile size of the static-frame gate (0 = gate off)
+    tile_gate_min_sum: int  # Summed tile difference that opens the gate
+
+    @classmethod
+    def from_config(cls, **overrides) -> "DetectorConfig":
+        """
+        Build settings from config.py, replacing the given overrides.
+
+        Args:
+            **overrides: Field values to use instead of the config.py
+                defaults; None keeps the default (e.g. an unset CLI option)
+
+        Returns:
+            The resolved settings
+        """
+        values = {
+            'threshold': config.MOTION_THRESHOLD,
+            'min_contour_area': config.MIN_CONTOUR_AREA,
+            'sensitivity': config.MOTION_SENSITIVITY,
+            'scale': config.DETECTION_SCALE,
+            'frame_skip': config.FRAME_SKIP,
+            'use_opencl': config.USE_OPENCL,
+            'hw_acceleration': config.HW_ACCELERATION,
+            'tile_gate_block': config.TILE_GATE_BLOCK,
+            'tile_gate_min_sum': config.TILE_GATE_MIN_SUM,
+        }
+        values.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**values)
@@ -6,10 +6,15 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
 import os
+import re
+import sys
+import subprocess
 import threading
-from typing import Optional, Tuple
+import concurrent.futures
+from typing import Dict, List, Optional, Tuple
 import config
-from video_processor import VideoProcessor, get_first_frame
+from detector_config import DetectorConfig
+from video_processor import VIDEO_EXTENSIONS, VideoProcessor, open_preview_capture
 
 
 class VideoPreviewWindow:
@@ -26,9 +31,8 @@ class VideoPreviewWindow:
         self.input_folder: str = config.INPUT_FOLDER
         self.output_folder: str = config.OUTPUT_FOLDER
         self.cap: Optional[cv2.VideoCapture] = None
-        self.current_frame: Optional[any] = None
-        self.original_frame: Optional[any] = None
         self.photo: Optional[ImageTk.PhotoImage] = None
+        self._photo_size: Optional[Tuple[int, int]] = None
         self.video_width: int = 0
         self.video_height: int = 0
         self.display_width: int = config.PREVIEW_WIDTH
@@ -40,14 +44,26 @@ class VideoPreviewWindow:
         self.roi_start: Optional[Tuple[int, int]] = None
         self.roi_end: Optional[Tuple[int, int]] = None
         self.roi: Optional[Tuple[int, int, int, int]] = None
+        self._roi_display: Optional[Tuple[int, int, int, int]] = None
         self.drawing: bool = False
+        self._drag_pending: bool = False
+        self._temp_roi_id: Optional[int] = None
         
         # Processing state
         self.processing: bool = False
         self.processor: Optional[VideoProcessor] = None
+        self._pending_progress: Optional[Tuple[float, str]] = None
+        
+        # Background loading of preview frames
+        self._load_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._current_load_future: Optional[concurrent.futures.Future] = None
+        
+        # Cached video listings per folder, keyed by folder mtime
+        self._dir_cache: Dict[str, Tuple[int, List[str]]] = {}
         
         # Create GUI elements
         self._create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
     def _create_widgets(self):
         """Create GUI widgets."""
@@ -82,7 +98,9 @@ class VideoPreviewWindow:
 
         # Video selection
         ttk.Label(control_frame, text="Preview Video:").grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
-        self.video_combo = ttk.Combobox(control_frame, width=47, state="readonly")
+        self.video_combo = ttk.Combobox(
+            control_frame, width=47, state="readonly", postcommand=self._populate_video_list
+        )
         self.video_combo.grid(row=2, column=1, padx=5, pady=(5, 0))
         self.video_combo.bind("<<ComboboxSelected>>", self._on_video_selected)
         self.refresh_btn = ttk.Button(control_frame, text="Refresh", command=self._refresh_video_list)
@@ -104,6 +122,9 @@ class VideoPreviewWindow:
         )
         self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # Persistent image item, updated in place on each redraw
+        self._canvas_img_id = self.canvas.create_image(0, 0, anchor=tk.NW)
+        
         # Bind mouse events for drawing
         self.canvas.bind("<ButtonPress-1>", self._on_mouse_press)
         self.canvas.bind("<B1-Motion>", self._on_mouse_drag)
@@ -123,24 +144,31 @@ class VideoPreviewWindow:
         settings_frame = ttk.LabelFrame(main_frame, text="Settings", padding="5")
         settings_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
         
+        # Numeric entries are validated per keystroke and read on commit
+        validate_num = (self.root.register(self._is_num), '%P')
+        
         ttk.Label(settings_frame, text="Padding Before (sec):").grid(row=0, column=0, padx=5)
-        self.padding_before_var = tk.StringVar(value=str(config.PADDING_BEFORE_SECONDS))
-        self.padding_before_entry = ttk.Entry(settings_frame, textvariable=self.padding_before_var, width=8)
+        self.padding_before_entry = ttk.Entry(settings_frame, width=8)
+        self.padding_before_entry.insert(0, str(config.PADDING_BEFORE_SECONDS))
+        self.padding_before_entry.config(validate='key', validatecommand=validate_num)
         self.padding_before_entry.grid(row=0, column=1, padx=5)
 
         ttk.Label(settings_frame, text="Padding After (sec):").grid(row=0, column=2, padx=5)
-        self.padding_after_var = tk.StringVar(value=str(config.PADDING_AFTER_SECONDS))
-        self.padding_after_entry = ttk.Entry(settings_frame, textvariable=self.padding_after_var, width=8)
+        self.padding_after_entry = ttk.Entry(settings_frame, width=8)
+        self.padding_after_entry.insert(0, str(config.PADDING_AFTER_SECONDS))
+        self.padding_after_entry.config(validate='key', validatecommand=validate_num)
         self.padding_after_entry.grid(row=0, column=3, padx=5)
 
         ttk.Label(settings_frame, text="Motion Sensitivity:").grid(row=0, column=4, padx=5)
-        self.sensitivity_var = tk.StringVar(value=str(config.MOTION_SENSITIVITY))
-        self.sensitivity_entry = ttk.Entry(settings_frame, textvariable=self.sensitivity_var, width=8)
+        self.sensitivity_entry = ttk.Entry(settings_frame, width=8)
+        self.sensitivity_entry.insert(0, str(config.MOTION_SENSITIVITY))
+        self.sensitivity_entry.config(validate='key', validatecommand=validate_num)
         self.sensitivity_entry.grid(row=0, column=5, padx=5)
 
         ttk.Label(settings_frame, text="Merge Gap (sec):").grid(row=0, column=6, padx=5)
-        self.merge_gap_var = tk.StringVar(value=str(config.MERGE_GAP_SECONDS))
-        self.merge_gap_entry = ttk.Entry(settings_frame, textvariable=self.merge_gap_var, width=8)
+        self.merge_gap_entry = ttk.Entry(settings_frame, width=8)
+        self.merge_gap_entry.insert(0, str(config.MERGE_GAP_SECONDS))
+        self.merge_gap_entry.config(validate='key', validatecommand=validate_num)
         self.merge_gap_entry.grid(row=0, column=7, padx=5)
         
         # Progress frame
@@ -187,6 +215,11 @@ class VideoPreviewWindow:
             self.open_output_btn
         ]
         
+    @staticmethod
+    def _is_num(value: str) -> bool:
+        """Allow only (partially typed) non-negative decimal numbers."""
+        return re.fullmatch(r"\d*\.?\d*", value) is not None
+    
     def _browse_input_folder(self):
         """Browse for input folder."""
         folder = filedialog.askdirectory(initialdir=self.input_folder_var.get())
@@ -202,15 +235,43 @@ class VideoPreviewWindow:
             self.output_folder_var.set(folder)
             self.output_folder = folder
     
-    def _refresh_video_list(self):
-        """Refresh the list of videos in the input folder."""
+    def _list_videos(self, force: bool = False) -> List[str]:
+        """
+        List the video files in the input folder.
+        
+        Args:
+            force: Re-scan the folder even if a cached listing is still valid
+            
+        Returns:
+            Sorted list of video file names
+        """
         self.input_folder = self.input_folder_var.get()
         
         if not os.path.exists(self.input_folder):
             os.makedirs(self.input_folder, exist_ok=True)
             
-        video_extensions = ('.mp4', '.MP4', '.avi', '.AVI', '.mov', '.MOV', '.mkv', '.MKV')
-        videos = [f for f in os.listdir(self.input_folder) if f.endswith(video_extensions)]
+        # Reuse the cached listing while the folder is unchanged
+        mtime = os.stat(self.input_folder).st_mtime_ns
+        cached = self._dir_cache.get(self.input_folder)
+        if not force and cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(self.input_folder) as entries:
+            videos = [
+                e.name for e in entries
+                if os.path.splitext(e.name)[1].lower() in VIDEO_EXTENSIONS and e.is_file()
+            ]
+        videos.sort()
+        self._dir_cache[self.input_folder] = (mtime, videos)
+        return videos
+    
+    def _populate_video_list(self):
+        """Fill the dropdown when it opens, from the cached listing if valid."""
+        self.video_combo['values'] = self._list_videos()
+    
+    def _refresh_video_list(self):
+        """Re-scan the input folder and preview the first video."""
+        videos = self._list_videos(force=True)
         
         self.video_combo['values'] = videos
         if videos:
@@ -228,16 +289,45 @@ class VideoPreviewWindow:
             self._load_video(video_path)
 
     def _load_video(self, video_path: str):
-        """Load a video for preview."""
+        """Load a video for preview without blocking the UI."""
         self.video_path = video_path
         
-        result = get_first_frame(video_path)
+        # Drop a load that is still queued for a previous selection
+        if self._current_load_future is not None:
+            self._current_load_future.cancel()
+        
+        def on_loaded(future):
+            if future.cancelled():
+                return
+            # Runs on the loader thread: hand both outcomes to the Tk thread
+            try:
+                result = future.result()
+            except Exception as e:
+                self.root.after(0, self._show_load_error, video_path, f"{video_path}: {e}")
+                return
+            self.root.after(0, self._apply_loaded_frame, video_path, result)
+        
+        self.status_label.config(text=f"Loading: {os.path.basename(video_path)}...")
+        self._current_load_future = self._load_executor.submit(open_preview_capture, video_path)
+        self._current_load_future.add_done_callback(on_loaded)
+    
+    def _apply_loaded_frame(self, video_path: str, result: Optional[tuple]):
+        """Show a loaded first frame (runs on the Tk thread)."""
+        # Ignore results for a video that is no longer selected
+        if video_path != self.video_path:
+            if result is not None:
+                result[0].release()
+            return
+        
         if result is None:
-            messagebox.showerror("Error", f"Could not open video: {video_path}")
+            self._show_load_error(video_path, video_path)
             return
         
-        frame, self.video_width, self.video_height = result
-        self.original_frame = frame
+        # Keep the capture open for later reads from the same video
+        self._release_capture()
+        self.cap, frame, self.video_width, self.video_height = result
+        # The finished future would otherwise keep the full-resolution frame alive
+        self._current_load_future = None
         
         # Calculate scaling
         self.scale_x = self.display_width / self.video_width
@@ -250,50 +340,85 @@ class VideoPreviewWindow:
         self.scale_x = new_width / self.video_width
         self.scale_y = new_height / self.video_height
         
-        # Resize frame for display
-        display_frame = cv2.resize(frame, (new_width, new_height))
+        # Convert BGR to RGB and resize in one PIL pass, then copy the result
+        # into the PhotoImage once. ImageTk converts pasted images into a new
+        # Tk block either way, so redraws only touch the ROI overlay and
+        # never paste the image again.
+        resized = Image.fromarray(frame[:, :, ::-1]).resize(
+            (new_width, new_height), Image.Resampling.BILINEAR
+        )
+        self._ensure_photo(new_width, new_height)
+        self.photo.paste(resized)
+        
+        # Only the display-sized copy is kept; drop the full-resolution frame
+        del frame, resized
         
         # Update canvas size
         self.canvas.config(width=new_width, height=new_height)
         
-        self._display_frame(display_frame)
         self._clear_roi()
         
         self.status_label.config(text=f"Loaded: {os.path.basename(video_path)} ({self.video_width}x{self.video_height})")
     
-    def _display_frame(self, frame):
-        """Display a frame on the canvas."""
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Convert to PIL Image
-        image = Image.fromarray(frame_rgb)
+    def _show_load_error(self, video_path: str, detail: str):
+        """Report a preview load that failed (runs on the Tk thread)."""
+        # Ignore failures for a video that is no longer selected
+        if video_path != self.video_path:
+            return
         
-        # Convert to PhotoImage
-        self.photo = ImageTk.PhotoImage(image)
+        self._current_load_future = None
+        self.status_label.config(text=f"Could not load: {os.path.basename(video_path)}")
+        messagebox.showerror("Error", f"Could not open video: {detail}")
+    
+    def _ensure_photo(self, width: int, height: int):
+        """Create the PhotoImage shown on the canvas when the size changes."""
+        if self._photo_size == (width, height):
+            return
         
-        # Display on canvas
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        # Opaque RGB photo: Tk's alpha blending path is slow and the preview
+        # never needs alpha
+        self.photo = ImageTk.PhotoImage('RGB', (width, height))
+        self._photo_size = (width, height)
+        self.canvas.itemconfig(self._canvas_img_id, image=self.photo)
+    
+    def _draw_roi(self):
+        """Draw the selected ROI rectangle over the current image."""
+        self.canvas.delete("roi")
         
         # Draw ROI if exists
-        if self.roi:
-            x1, y1, x2, y2 = self.roi
-            # Scale to display coordinates
-            dx1 = int(x1 * self.scale_x)
-            dy1 = int(y1 * self.scale_y)
-            dx2 = int(x2 * self.scale_x)
-            dy2 = int(y2 * self.scale_y)
-            self.canvas.create_rectangle(dx1, dy1, dx2, dy2, outline="green", width=2, tags="roi")
+        if self._roi_display:
+            self.canvas.create_rectangle(*self._roi_display, outline="green", width=2, tags="roi")
+    
+    def _set_roi(self, roi: Optional[Tuple[int, int, int, int]]):
+        """Set the ROI in video coordinates and cache its display coordinates."""
+        self.roi = roi
+        if roi is None:
+            self._roi_display = None
+        else:
+            x1, y1, x2, y2 = roi
+            self._roi_display = (
+                int(x1 * self.scale_x), int(y1 * self.scale_y),
+                int(x2 * self.scale_x), int(y2 * self.scale_y)
+            )
+    
+    def _release_capture(self):
+        """Release the preview video capture, if any."""
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
     
     def _clear_canvas(self):
         """Clear the canvas."""
-        self.canvas.delete("all")
+        self._release_capture()
+        self.canvas.delete("roi")
+        self._clear_temp_rectangle()
+        self.canvas.itemconfig(self._canvas_img_id, image="")
         self.photo = None
+        self._photo_size = None
     
     def _on_mouse_press(self, event):
         """Handle mouse press for ROI drawing."""
-        if self.original_frame is None:
+        if self.photo is None:
             return
         
         self.drawing = True
@@ -302,68 +427,91 @@ class VideoPreviewWindow:
     
     def _on_mouse_drag(self, event):
         """Handle mouse drag for ROI drawing."""
-        if not self.drawing or self.original_frame is None:
+        if not self.drawing or self.photo is None:
             return
         
         self.roi_end = (event.x, event.y)
-        self._draw_temp_rectangle()
+        
+        # Coalesce motion events into one overlay update per idle cycle
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.root.after_idle(self._flush_drag)
+    
+    def _flush_drag(self):
+        """Draw the rubber band for the latest drag position."""
+        self._drag_pending = False
+        if self.drawing:
+            self._draw_temp_rectangle()
     
     def _on_mouse_release(self, event):
         """Handle mouse release for ROI drawing."""
-        if not self.drawing or self.original_frame is None:
+        if not self.drawing or self.photo is None:
             return
         
         self.drawing = False
         self.roi_end = (event.x, event.y)
         
         if self.roi_start and self.roi_end:
-            # Convert display coordinates to video coordinates
-            x1 = int(min(self.roi_start[0], self.roi_end[0]) / self.scale_x)
-            y1 = int(min(self.roi_start[1], self.roi_end[1]) / self.scale_y)
-            x2 = int(max(self.roi_start[0], self.roi_end[0]) / self.scale_x)
-            y2 = int(max(self.roi_start[1], self.roi_end[1]) / self.scale_y)
+            # Order the corners and convert display to video coordinates
+            sx, sy = self.roi_start
+            ex, ey = self.roi_end
+            lo_x, hi_x = (sx, ex) if sx < ex else (ex, sx)
+            lo_y, hi_y = (sy, ey) if sy < ey else (ey, sy)
+            inv_sx = 1.0 / self.scale_x
+            inv_sy = 1.0 / self.scale_y
+            x1 = int(lo_x * inv_sx)
+            y1 = int(lo_y * inv_sy)
+            x2 = int(hi_x * inv_sx)
+            y2 = int(hi_y * inv_sy)
             
             # Ensure within bounds
-            x1 = max(0, min(x1, self.video_width))
-            y1 = max(0, min(y1, self.video_height))
-            x2 = max(0, min(x2, self.video_width))
-            y2 = max(0, min(y2, self.video_height))
+            w, h = self.video_width, self.video_height
+            x1 = 0 if x1 < 0 else (w if x1 > w else x1)
+            y1 = 0 if y1 < 0 else (h if y1 > h else y1)
+            x2 = 0 if x2 < 0 else (w if x2 > w else x2)
+            y2 = 0 if y2 < 0 else (h if y2 > h else y2)
             
-            # Check minimum size
-            if abs(x2 - x1) > 10 and abs(y2 - y1) > 10:
-                self.roi = (x1, y1, x2, y2)
+            # Check minimum size (corners are already ordered)
+            if x2 - x1 > 10 and y2 - y1 > 10:
+                self._set_roi((x1, y1, x2, y2))
                 self.roi_label.config(text=f"ROI: ({x1}, {y1}) to ({x2}, {y2}) - Size: {x2-x1}x{y2-y1}")
             else:
-                self.roi = None
+                self._set_roi(None)
                 self.roi_label.config(text="ROI: Too small - Draw a larger rectangle")
         
-        self._redraw_frame()
+        # The image is unchanged, only swap the rubber band for the final ROI
+        self._clear_temp_rectangle()
+        self._draw_roi()
     
     def _draw_temp_rectangle(self):
         """Draw temporary rectangle while dragging."""
         if self.roi_start and self.roi_end:
-            self._redraw_frame()
-            self.canvas.create_rectangle(
-                self.roi_start[0], self.roi_start[1],
-                self.roi_end[0], self.roi_end[1],
-                outline="yellow", width=2, tags="temp_roi"
-            )
+            coords = (*self.roi_start, *self.roi_end)
+            # Move the existing rubber band instead of recreating the item
+            if self._temp_roi_id is None:
+                self._temp_roi_id = self.canvas.create_rectangle(
+                    *coords, outline="yellow", width=2, tags="temp_roi"
+                )
+            else:
+                self.canvas.coords(self._temp_roi_id, *coords)
+    
+    def _clear_temp_rectangle(self):
+        """Remove the temporary drag rectangle."""
+        self.canvas.delete("temp_roi")
+        self._temp_roi_id = None
     
     def _redraw_frame(self):
-        """Redraw the current frame with ROI."""
-        if self.original_frame is None:
+        """Redraw the ROI over the current frame."""
+        if self.photo is None:
             return
         
-        # Resize frame for display
-        new_width = int(self.video_width * self.scale_x)
-        new_height = int(self.video_height * self.scale_y)
-        display_frame = cv2.resize(self.original_frame, (new_width, new_height))
-        
-        self._display_frame(display_frame)
+        # The PhotoImage still holds the frame: only redraw the overlays
+        self._clear_temp_rectangle()
+        self._draw_roi()
     
     def _clear_roi(self):
         """Clear the current ROI."""
-        self.roi = None
+        self._set_roi(None)
         self.roi_start = None
         self.roi_end = None
         self.roi_label.config(text="ROI: Not selected - Draw a rectangle on the video")
@@ -383,27 +531,20 @@ class VideoPreviewWindow:
             return
         
         try:
-            padding_before = float(self.padding_before_var.get())
-            padding_after = float(self.padding_after_var.get())
-            sensitivity = float(self.sensitivity_var.get())
-            merge_gap = float(self.merge_gap_var.get())
+            padding_before = float(self.padding_before_entry.get())
+            padding_after = float(self.padding_after_entry.get())
+            sensitivity = float(self.sensitivity_entry.get())
+            merge_gap = float(self.merge_gap_entry.get())
         except ValueError:
             messagebox.showerror("Error", "Invalid settings values!")
             return
         
-        # Update config
-        config.MOTION_SENSITIVITY = sensitivity
-        
         self.processing = True
         self.process_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
 
         # Disable other widgets during processing
-        for widget in self.widgets_to_disable:
-            if widget == self.video_combo:
-                widget.config(state=tk.DISABLED)
-            else:
-                widget.config(state=tk.DISABLED)
+        self.root.after_idle(self._apply_widget_states, tk.DISABLED)
 
         # Start processing in a separate thread
         self.processor = VideoProcessor(
@@ -411,25 +552,24 @@ class VideoPreviewWindow:
             output_folder=self.output_folder,
             padding_before=padding_before,
             padding_after=padding_after,
-            merge_gap=merge_gap
+            merge_gap=merge_gap,
+            detector_config=DetectorConfig.from_config(sensitivity=sensitivity)
         )
         
         thread = threading.Thread(target=self._process_videos_thread)
         thread.daemon = True
         thread.start()
+        
+        self.root.after(50, self._poll_progress)
     
     def _process_videos_thread(self):
         """Process videos in a separate thread."""
         was_stopped = False
         try:
-            def progress_callback(status, video_idx, total_videos, video_name):
-                if not self.processing:
-                    return
-                
-                progress = (video_idx / total_videos) * 100 if total_videos > 0 else 0
-                self.root.after(0, lambda: self._update_progress(progress, f"{status}: {video_name}"))
+            results = self.processor.process_all_videos(self.roi, self._post_progress)
             
-            results = self.processor.process_all_videos(self.roi, progress_callback)
+            # Discard any queued update so it can't overwrite the final status
+            self._pending_progress = None
             
             # Check if we were stopped
             if self.processor.is_stop_requested():
@@ -441,12 +581,36 @@ class VideoPreviewWindow:
                 self.root.after(0, lambda: self._processing_complete(total_clips, len(results)))
                 
         except Exception as e:
+            self._pending_progress = None
             if not was_stopped:
                 self.root.after(0, lambda: self._processing_error(str(e)))
         finally:
             self.processing = False
             self.root.after(0, self._reset_ui)
     
+    def _post_progress(self, status: str, video_idx: int, total_videos: int, video_name: str):
+        """
+        Record the latest progress from the worker thread.
+        
+        Only stores the update; the Tk side picks it up in _poll_progress,
+        so the worker never calls into Tk for progress.
+        """
+        if not self.processing:
+            return
+        
+        progress = (video_idx / total_videos) * 100 if total_videos > 0 else 0
+        self._pending_progress = (progress, f"{status}: {video_name}")
+    
+    def _poll_progress(self):
+        """Apply the latest pending progress update while processing runs."""
+        pending = self._pending_progress
+        if pending is not None:
+            self._pending_progress = None
+            self._update_progress(*pending)
+        
+        if self.processing:
+            self.root.after(50, self._poll_progress)
+    
     def _update_progress(self, progress: float, status: str):
         """Update progress bar and status label."""
         self.progress_var.set(progress)
@@ -476,11 +640,15 @@ class VideoPreviewWindow:
         self.stop_btn.config(state=tk.DISABLED)
 
         # Re-enable widgets
+        self.root.after_idle(self._apply_widget_states, tk.NORMAL)
+    
+    def _apply_widget_states(self, state: str):
+        """Set the state of all widgets that are locked during processing."""
         for widget in self.widgets_to_disable:
-            if widget == self.video_combo:
+            if widget == self.video_combo and state == tk.NORMAL:
                 widget.config(state="readonly")
             else:
-                widget.config(state=tk.NORMAL)
+                widget.config(state=state)
     
     def _stop_processing(self):
         """Stop the current processing."""
@@ -499,16 +667,36 @@ class VideoPreviewWindow:
     def _open_output_folder(self):
         """Open the output folder in file explorer."""
         output_folder = self.output_folder_var.get()
-        if os.path.exists(output_folder):
-            os.startfile(output_folder)
-        else:
+        if not os.path.isdir(output_folder):
             messagebox.showinfo("Info", "Output folder does not exist yet.")
+            return
+        
+        if os.name == 'nt':
+            opener = ['explorer']
+        elif sys.platform == 'darwin':
+            opener = ['open']
+        else:
+            opener = ['xdg-open']
+        
+        # Spawn without waiting so the UI thread never blocks on the shell
+        try:
+            subprocess.Popen([*opener, output_folder], close_fds=True, start_new_session=True)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not open output folder: {e}")
 
+    def _on_close(self):
+        """Stop any processing, release preview resources and close the window."""
+        # The worker pools of a running job would otherwise keep the
+        # process alive, with no window, until every video is exported
+        if self.processing and self.processor:
+            self.processing = False
+            self.processor.request_stop()
+        self._release_capture()
+        self._load_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def run(self):
         """Run the application."""
-        # Initial refresh of video list
-        self._refresh_video_list()
-        
         # Start the main loop
         self.root.mainloop()
 
@@ -22,6 +22,7 @@ Install dependencies:
 import sys
 import os
 import argparse
+import multiprocessing
 
 # Add the current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -81,6 +82,7 @@ def run_gui():
 
 def run_cli(args):
     """Run the CLI processing mode."""
+    from detector_config import DetectorConfig
     from video_processor import VideoProcessor
     
     print("=" * 50)
@@ -88,21 +90,21 @@ def run_cli(args):
     print("=" * 50)
     print()
     
-    # Update config with CLI arguments
-    if args.threshold is not None:
-        config.MOTION_THRESHOLD = args.threshold
-    if args.min_area is not None:
-        config.MIN_CONTOUR_AREA = args.min_area
-    if args.sensitivity is not None:
-        config.MOTION_SENSITIVITY = args.sensitivity
-    if args.padding_before is not None:
-        config.PADDING_BEFORE_SECONDS = args.padding_before
-    if args.padding_after is not None:
-        config.PADDING_AFTER_SECONDS = args.padding_after
-    if args.merge_gap is not None:
-        config.MERGE_GAP_SECONDS = args.merge_gap
-    if args.frame_skip is not None:
-        config.FRAME_SKIP = args.frame_skip
+    # Resolve settings from CLI arguments, falling back to config defaults
+    detector_config = DetectorConfig.from_config(
+        threshold=args.threshold,
+        min_contour_area=args.min_area,
+        sensitivity=args.sensitivity,
+        frame_skip=args.frame_skip,
+        use_opencl=args.opencl or None
+    )
+    padding_before = (
+        args.padding_before if args.padding_before is not None else config.PADDING_BEFORE_SECONDS
+    )
+    padding_after = (
+        args.padding_after if args.padding_after is not None else config.PADDING_AFTER_SECONDS
+    )
+    merge_gap = args.merge_gap if args.merge_gap is not None else config.MERGE_GAP_SECONDS
     
     # Ensure directories exist
     input_dir, output_dir = ensure_directories(args.input, args.output)
@@ -114,31 +116,44 @@ def run_cli(args):
     
     # Print current settings
     print("Motion Detection Settings:")
-    print(f"  - Threshold: {config.MOTION_THRESHOLD}")
-    print(f"  - Min contour area: {config.MIN_CONTOUR_AREA}")
-    print(f"  - Sensitivity: {config.MOTION_SENSITIVITY}")
-    print(f"  - Frame skip: {config.FRAME_SKIP}")
+    print(f"  - Threshold: {detector_config.threshold}")
+    print(f"  - Min contour area: {detector_config.min_contour_area}")
+    print(f"  - Sensitivity: {detector_config.sensitivity}")
+    print(f"  - Frame skip: {detector_config.frame_skip}")
+    print(f"  - OpenCL: {'on' if detector_config.use_opencl else 'off'}")
     print()
     print("Export Settings:")
-    print(f"  - Padding before: {config.PADDING_BEFORE_SECONDS}s")
-    print(f"  - Padding after: {config.PADDING_AFTER_SECONDS}s")
-    print(f"  - Merge gap: {config.MERGE_GAP_SECONDS}s")
+    print(f"  - Padding before: {padding_before}s")
+    print(f"  - Padding after: {padding_after}s")
+    print(f"  - Merge gap: {merge_gap}s")
     print()
     
     # Create video processor
     processor = VideoProcessor(
         input_folder=input_dir,
         output_folder=output_dir,
-        padding_before=config.PADDING_BEFORE_SECONDS,
-        padding_after=config.PADDING_AFTER_SECONDS,
-        merge_gap=config.MERGE_GAP_SECONDS
+        padding_before=padding_before,
+        padding_after=padding_after,
+        merge_gap=merge_gap,
+        detector_config=detector_config
     )
     
     # Get video files
     if args.videos:
-        # Process specific videos
+        # Process specific videos. One listing of the input folder answers
+        # the existence check for plain file names without a stat() each.
+        try:
+            with os.scandir(input_dir) as entries:
+                available = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            available = {}
+        
         video_files = []
         for video in args.videos:
+            if video in available:
+                video_files.append(available[video])
+                continue
+            
             if os.path.isabs(video):
                 video_path = video
             else:
@@ -293,6 +308,11 @@ Examples:
         metavar='N',
         help=f'Process every Nth frame for faster processing (default: {config.FRAME_SKIP})'
     )
+    motion_group.add_argument(
+        '--opencl',
+        action='store_true',
+        help='Run motion detection on the GPU via OpenCL when available'
+    )
     
     # Export settings
     export_group = parser.add_argument_group('Export Settings')
@@ -332,4 +352,6 @@ Examples:
 
 
 if __name__ == "__main__":
+    # Needed for process_all_videos' worker processes in frozen builds
+    multiprocessing.freeze_support()
     sys.exit(main() or 0)
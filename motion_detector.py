@@ -3,148 +3,657 @@ Motion detection module for analyzing video frames within a specified region of
 """
 import cv2
 import numpy as np
-from typing import Tuple, Optional, List
+import queue
+import subprocess
+import threading
+import time
+from typing import Callable, Iterator, Tuple, Optional, List
 import config
+from detector_config import DetectorConfig
+from _motion_kernel import diff_threshold
+
+
+def open_capture(video_path: str, hw_acceleration: bool = config.HW_ACCELERATION) -> cv2.VideoCapture:
+    """
+    Open a video for sequential decoding through the FFmpeg backend.
+    
+    Naming the backend skips OpenCV's backend probing, and the capture's
+    internal buffer is kept to a single frame since reads never rewind.
+    
+    Args:
+        video_path: Path to the video file
+        hw_acceleration: Request any available hardware decoder (NVDEC,
+            VA-API, VideoToolbox, ...) through the FFmpeg backend
+            
+    Returns:
+        The opened capture; falls back to the default backend when the
+        FFmpeg open fails. Check isOpened() on the result.
+    """
+    params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY] if hw_acceleration else []
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(video_path)
+    
+    # Not every backend supports this; it is only a hint
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    
+    return cap
+
+
+
+class RoiPipeCapture:
+    """
+    Sequential reader of ROI-cropped grayscale frames decoded by ffmpeg.
+    
+    The ROI crop, the downscale to detection size and the gray conversion
+    run in ffmpeg's filtergraph, so only the analyzed luma bytes cross the
+    pipe into Python. Frames come as a YUV4MPEG stream, whose header
+    states the frame size ffmpeg actually produces. Implements the
+    read()/grab()/release() subset of cv2.VideoCapture used by
+    MotionDetector._decode_loop.
+    """
+    
+    def __init__(self, process: subprocess.Popen, width: int, height: int):
+        self._process = process
+        self._shape = (height, width)
+        self._frame_bytes = width * height
+        self._pending = None
+    
+    @classmethod
+    def open(
+        cls,
+        ffmpeg_path: str,
+        video_path: str,
+        bounds: Tuple[int, int, int, int],
+        output_size: Optional[Tuple[int, int]] = None,
+        hw_acceleration: bool = False,
+        threads: int = 0
+    ) -> Optional["RoiPipeCapture"]:
+        """
+        Start ffmpeg decoding the ROI of a video.
+        
+        Args:
+            ffmpeg_path: ffmpeg executable
+            video_path: Path to the video file
+            bounds: Clamped ROI as (x1, y1, x2, y2)
+            output_size: (width, height) to downscale the crop to, or None
+                to keep it at full resolution
+            hw_acceleration: Let ffmpeg pick a hardware decoder
+            threads: Decoder and filter threads for ffmpeg (0 = its default)
+            
+        Returns:
+            The reader, or None if ffmpeg did not produce a first frame of
+            the expected size (missing binary, unsupported file, ...)
+        """
+        x1, y1, x2, y2 = bounds
+        width, height = x2 - x1, y2 - y1
+        # Convert to gray before cropping: on subsampled input (yuv420p)
+        # crop would otherwise round odd sizes and offsets to even ones
+        filters = f"format=gray,crop={width}:{height}:{x1}:{y1}:exact=1"
+        if output_size is not None and output_size != (width, height):
+            width, height = output_size
+            filters += f",scale={width}:{height}:flags=area"
+        command = [
+            ffmpeg_path, '-hide_banner', '-loglevel', 'error', '-nostdin',
+            *(['-hwaccel', 'auto'] if hw_acceleration else []),
+            *(['-threads', str(threads)] if threads else []),
+            '-i', video_path,
+            '-map', '0:v:0',
+            *(['-filter_threads', str(threads)] if threads else []),
+            '-vf', filters,
+            # Pass decoded frames through as-is so frame indices match the
+            # OpenCV capture used for export
+            '-fps_mode', 'passthrough',
+            '-f', 'yuv4mpegpipe', '-pix_fmt', 'gray', '-'
+        ]
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=width * height * 4
+            )
+        except OSError:
+            return None
+        
+        reader = cls(process, width, height)
+        if reader._read_header() != (width, height):
+            reader.release()
+            return None
+        ret, frame = reader.read()
+        if not ret:
+            reader.release()
+            return None
+        reader._pending = frame
+        return reader
+    
+    def _read_header(self) -> Optional[Tuple[int, int]]:
+        """Read the stream header and return the (width, height) it declares."""
+        header = self._process.stdout.readline().split()
+        if not header or header[0] != b'YUV4MPEG2':
+            return None
+        fields = {field[:1]: field[1:] for field in header[1:]}
+        try:
+            return int(fields[b'W']), int(fields[b'H'])
+        except (KeyError, ValueError):
+            return None
+    
+    @property
+    def frame_shape(self) -> Tuple[int, int]:
+        """Shape of the frames returned by read()."""
+        return self._shape
+    
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Return (True, frame) for the next frame, or (False, None) at the end."""
+        if self._pending is not None:
+            frame, self._pending = self._pending, None
+            return True, frame
+        stdout = self._process.stdout
+        # Every frame is preceded by a "FRAME" line
+        if not stdout.readline().startswith(b'FRAME'):
+            return False, None
+        data = stdout.read(self._frame_bytes)
+        if len(data) < self._frame_bytes:
+            return False, None
+        return True, np.frombuffer(data, dtype=np.uint8).reshape(self._shape)
+    
+    def grab(self) -> bool:
+        """Skip the next frame; returns False at the end."""
+        return self.read()[0]
+    
+    def release(self):
+        """Stop ffmpeg and close the pipe."""
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.stdout.close()
+        self._process.wait()
 
 
 class MotionDetector:
     """Detects motion within a specified region of interest in video frames."""
     
-    def __init__(
-        self,
-        threshold: int = config.MOTION_THRESHOLD,
-        min_contour_area: int = config.MIN_CONTOUR_AREA,
-        sensitivity: float = config.MOTION_SENSITIVITY
-    ):
+    def __init__(self, detector_config: Optional[DetectorConfig] = None):
         """
         Initialize the motion detector.
         
         Args:
-            threshold: Threshold for pixel difference to be considered motion
-            min_contour_area: Minimum contour area to be considered motion
-            sensitivity: Percentage of ROI area that needs to change
+            detector_config: Detection settings; None uses the config.py defaults
         """
-        self.threshold = threshold
-        self.min_contour_area = min_contour_area
-        self.sensitivity = sensitivity
-        self.previous_frame: Optional[np.ndarray] = None
-        self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
-            history=500,
-            varThreshold=16,
-            detectShadows=True
-        )
+        if detector_config is None:
+            detector_config = DetectorConfig.from_config()
+        self.detector_config = detector_config
+        self.threshold = detector_config.threshold
+        self.min_contour_area = detector_config.min_contour_area
+        self.sensitivity = detector_config.sensitivity
+        self.scale = scale = detector_config.scale
+        self.frame_skip = detector_config.frame_skip
+        self.hw_acceleration = detector_config.hw_acceleration
+        self._tile_gate_block = detector_config.tile_gate_block
+        self._tile_gate_min_sum = detector_config.tile_gate_min_sum
+        # Area and blur kernel are given at full resolution, adjust them to the detection scale
+        self._scaled_min_area = self.min_contour_area * scale * scale
+        self._blur_ksize = max(3, int(21 * scale) | 1)
+        # Run the pipeline on cv2.UMat only if an OpenCL device is available
+        self.use_opencl = detector_config.use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        # One 5x5 dilation is equivalent to two passes with the default 3x3 kernel
+        self._dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+        # Previous ROI frame (np.ndarray, or cv2.UMat on the OpenCL path) and its size
+        self.previous_frame = None
+        self._prev_size: Optional[Tuple[int, int]] = None
+        # Working buffers for the NumPy path, reused across frames via dst=
+        self._buf_sizes: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None
+        self._gray: Optional[np.ndarray] = None
+        self._small: Optional[np.ndarray] = None
+        self._blur_out: Optional[np.ndarray] = None
+        self._prev: Optional[np.ndarray] = None
+        self._delta: Optional[np.ndarray] = None
+        self._thresh: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+        self._coarse: Optional[np.ndarray] = None
+        self._coarse_ref: Optional[np.ndarray] = None
+        self._coarse_delta: Optional[np.ndarray] = None
+        self._coarse_ii: Optional[np.ndarray] = None
+        self._tile_corners: Optional[Tuple[np.ndarray, ...]] = None
+        # Frame differencing does not use the background model, so it is
+        # only built on first access
+        self._background_subtractor = None
+    
+    @property
+    def background_subtractor(self):
+        """MOG2 background model, created lazily."""
+        if self._background_subtractor is None:
+            self._background_subtractor = cv2.createBackgroundSubtractorMOG2(
+                history=500,
+                varThreshold=16,
+                detectShadows=True
+            )
+        return self._background_subtractor
     
     def reset(self):
-        """Reset the detector state for a new video."""
+        """
+        Reset the detector state for a new video.
+        
+        Only the reference frame and the background model are dropped. The
+        working buffers and the dilation kernel are kept, so consecutive
+        videos with the same ROI size reuse them.
+        """
+        self.previous_frame = None
+        # clear() does not forget a learned MOG2 model, so drop it instead;
+        # it is rebuilt lazily, and only if something uses it
+        self._background_subtractor = None
+    
+    def _detection_size(self, crop_size: Tuple[int, int]) -> Tuple[int, int]:
+        """Return the (width, height) of a full-resolution ROI crop at detection scale."""
+        scale = self.scale
+        if scale == 1.0:
+            return crop_size
+        return max(1, int(crop_size[0] * scale)), max(1, int(crop_size[1] * scale))
+    
+    def _ensure_buffers(self, crop_size: Tuple[int, int], roi_size: Tuple[int, int]):
+        """
+        Allocate the working buffers when the ROI size changes.
+        
+        Args:
+            crop_size: (width, height) of the ROI crop at full resolution
+            roi_size: (width, height) of the ROI at detection scale
+        """
+        if self._buf_sizes == (crop_size, roi_size):
+            return
+        
+        crop_shape = (crop_size[1], crop_size[0])
+        roi_shape = (roi_size[1], roi_size[0])
+        self._gray = np.empty(crop_shape, dtype=np.uint8)
+        self._small = np.empty(roi_shape, dtype=np.uint8)
+        self._blur_out = np.empty(roi_shape, dtype=np.uint8)
+        self._prev = np.empty(roi_shape, dtype=np.uint8)
+        self._delta = np.empty(roi_shape, dtype=np.uint8)
+        self._thresh = np.empty(roi_shape, dtype=np.uint8)
+        self._mask = np.empty(roi_shape, dtype=np.uint8)
+        coarse_shape = (max(1, crop_shape[0] // 8), max(1, crop_shape[1] // 8))
+        self._coarse = np.empty(coarse_shape, dtype=np.uint8)
+        self._coarse_ref = np.empty(coarse_shape, dtype=np.uint8)
+        self._coarse_delta = np.empty(coarse_shape, dtype=np.uint8)
+        self._coarse_ii = np.empty((coarse_shape[0] + 1, coarse_shape[1] + 1), dtype=np.int32)
+        self._tile_corners = self._tile_index(coarse_shape) if self._tile_gate_block else None
+        self._buf_sizes = (crop_size, roi_size)
+        # The old reference frame has no matching coarse reference
         self.previous_frame = None
-        self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
-            history=500,
-            varThreshold=16,
-            detectShadows=True
+    
+    def _store_previous(self, roi_gray, roi_size: Tuple[int, int]):
+        """Keep the processed ROI as the reference for the next frame."""
+        self.previous_frame = roi_gray
+        self._prev_size = roi_size
+        if not self.use_opencl:
+            # Double buffering: the next frame is blurred into the other buffer
+            self._blur_out, self._prev = self._prev, self._blur_out
+            self._coarse, self._coarse_ref = self._coarse_ref, self._coarse
+    
+    def _tile_index(self, coarse_shape: Tuple[int, int]) -> Tuple[np.ndarray, ...]:
+        """
+        Locate the gate tiles in the flattened integral image.
+        
+        Tiles are K x K at stride K/2, with a last row and column flush with
+        the far edges. The result only depends on the coarse ROI size.
+        
+        Args:
+            coarse_shape: Shape of the 8x-decimated ROI
+            
+        Returns:
+            Flat integral-image indices of the four corners of every tile,
+            ordered so that a - b - c + d is the tile sum
+        """
+        rows, cols = coarse_shape
+        k_y = min(self._tile_gate_block, rows)
+        k_x = min(self._tile_gate_block, cols)
+        ys = np.unique(np.append(np.arange(0, rows - k_y + 1, max(1, k_y // 2)), rows - k_y))
+        xs = np.unique(np.append(np.arange(0, cols - k_x + 1, max(1, k_x // 2)), cols - k_x))
+        stride = cols + 1
+        top = ys[:, None] * stride
+        bottom = (ys + k_y)[:, None] * stride
+        left = xs[None, :]
+        right = (xs + k_x)[None, :]
+        return (
+            (bottom + right).ravel(), (top + right).ravel(),
+            (bottom + left).ravel(), (top + left).ravel()
         )
     
-    def detect_motion(
+    def _tile_gate_passes(self, coarse: np.ndarray, reference: np.ndarray) -> bool:
+        """
+        Check whether any tile of the coarse difference image changed enough.
+        
+        Sums |coarse - reference| over the tiles from _tile_index using an
+        integral image, so each tile costs four lookups.
+        
+        Args:
+            coarse: Current ROI in grayscale, decimated 8x
+            reference: Decimated ROI of the last analyzed frame
+            
+        Returns:
+            True if the largest tile sum reaches the gate threshold
+        """
+        delta = cv2.absdiff(coarse, reference, dst=self._coarse_delta)
+        ii = cv2.integral(delta, self._coarse_ii).ravel()
+        a, b, c, d = self._tile_corners
+        sums = ii[a] - ii[b] - ii[c] + ii[d]
+        return sums.max() >= self._tile_gate_min_sum
+    
+    @staticmethod
+    def _clamp_roi(
+        roi: Optional[Tuple[int, int, int, int]],
+        frame_shape: Tuple[int, ...]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Normalize an ROI and clamp it to the frame.
+        
+        Args:
+            roi: Region of interest as (x1, y1, x2, y2), or None for full frame
+            frame_shape: Shape of the video frames
+            
+        Returns:
+            (x1, y1, x2, y2) with x1 < x2 and y1 < y2, or None if the ROI
+            lies outside the frame
+        """
+        h, w = frame_shape[:2]
+        if roi is None:
+            return 0, 0, w, h
+        
+        x1, y1, x2, y2 = roi
+        # Normalize coordinates (ensure x1 < x2 and y1 < y2)
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        # Ensure coordinates are within frame bounds
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(w, x2), min(h, y2)
+        # Ensure ROI has valid dimensions
+        if x2 <= x1 or y2 <= y1:
+            return None
+        return x1, y1, x2, y2
+    
+    def _measure_motion(
         self,
         frame: np.ndarray,
         roi: Optional[Tuple[int, int, int, int]] = None
-    ) -> Tuple[bool, float, np.ndarray]:
+    ) -> Tuple[bool, float, Optional[np.ndarray], Optional[Tuple[int, int, int, int]]]:
         """
-        Detect motion in the frame within the specified region of interest.
+        Run the detection pipeline on a frame without drawing anything.
         
         Args:
             frame: The current video frame
             roi: Region of interest as (x1, y1, x2, y2), or None for full frame
             
         Returns:
-            Tuple of (motion_detected, motion_percentage, visualization_frame)
+            Tuple of (motion_detected, motion_percentage, blob_stats, bounds).
+            blob_stats holds the connectedComponentsWithStats rows of the
+            qualifying blobs, or None when there was no previous frame to
+            compare against. bounds is the clamped ROI, or None when the
+            ROI lies outside the frame.
         """
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (21, 21), 0)
-        
         # Extract ROI if specified
-        if roi is not None:
-            x1, y1, x2, y2 = roi
-            # Normalize coordinates (ensure x1 < x2 and y1 < y2)
-            if x1 > x2:
-                x1, x2 = x2, x1
-            if y1 > y2:
-                y1, y2 = y2, y1
-            # Ensure coordinates are within frame bounds
-            h, w = gray.shape[:2]
-            x1, y1 = max(0, x1), max(0, y1)
-            x2, y2 = min(w, x2), min(h, y2)
-            # Ensure ROI has valid dimensions
-            if x2 <= x1 or y2 <= y1:
-                self.previous_frame = None
-                return False, 0.0, frame.copy()
-            roi_gray = gray[y1:y2, x1:x2]
+        bounds = self._clamp_roi(roi, frame.shape)
+        if bounds is None:
+            self.previous_frame = None
+            return False, 0.0, None, None
+        x1, y1, x2, y2 = bounds
+        
+        # Convert, downscale and blur only the ROI, not the whole frame.
+        # On the OpenCL path the same calls run on the GPU via cv2.UMat;
+        # the NumPy path writes into preallocated buffers.
+        scale = self.scale
+        crop_size = (x2 - x1, y2 - y1)
+        roi_size = self._detection_size(crop_size)
+        ksize = (self._blur_ksize, self._blur_ksize)
+        
+        if self.use_opencl:
+            src = cv2.UMat(cv2.UMat(frame), [y1, y2], [x1, x2])
+            roi_gray = cv2.cvtColor(src, cv2.COLOR_BGR2GRAY)
+            if scale != 1.0:
+                roi_gray = cv2.resize(roi_gray, roi_size, interpolation=cv2.INTER_AREA)
+            roi_gray = cv2.GaussianBlur(roi_gray, ksize, 0)
         else:
-            roi_gray = gray
-            x1, y1 = 0, 0
+            self._ensure_buffers(crop_size, roi_size)
+            roi_gray = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY, dst=self._gray)
+            
+            # Tile gate: a static frame is rejected from an 8x-decimated
+            # difference before it is blurred. A rejected frame is not
+            # stored, so the references stay on the last analyzed frame
+            # until the accumulated change opens the gate again.
+            if self._tile_gate_block:
+                coarse = cv2.resize(
+                    roi_gray, self._coarse.shape[::-1], dst=self._coarse,
+                    interpolation=cv2.INTER_AREA
+                )
+                if (
+                    self.previous_frame is not None
+                    and self._prev_size == roi_size
+                    and not self._tile_gate_passes(coarse, self._coarse_ref)
+                ):
+                    return False, 0.0, np.empty((0, 5), dtype=np.int32), (x1, y1, x2, y2)
+            
+            if scale != 1.0:
+                roi_gray = cv2.resize(
+                    roi_gray, roi_size, dst=self._small, interpolation=cv2.INTER_AREA
+                )
+            roi_gray = cv2.GaussianBlur(roi_gray, ksize, 0, dst=self._blur_out)
         
         # Initialize previous frame if needed
         if self.previous_frame is None:
-            self.previous_frame = roi_gray.copy()
-            visualization = frame.copy()
-            if roi is not None:
-                cv2.rectangle(visualization, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            return False, 0.0, visualization
+            self._store_previous(roi_gray, roi_size)
+            return False, 0.0, None, (x1, y1, x2, y2)
         
         # Resize previous frame if ROI size changed
-        if self.previous_frame.shape != roi_gray.shape:
-            self.previous_frame = roi_gray.copy()
-            visualization = frame.copy()
-            if roi is not None:
-                cv2.rectangle(visualization, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            return False, 0.0, visualization
+        if self._prev_size != roi_size:
+            self._store_previous(roi_gray, roi_size)
+            return False, 0.0, None, (x1, y1, x2, y2)
         
         # Compute absolute difference
-        frame_delta = cv2.absdiff(self.previous_frame, roi_gray)
-        thresh = cv2.threshold(frame_delta, self.threshold, 255, cv2.THRESH_BINARY)[1]
+        if self.use_opencl:
+            frame_delta = cv2.absdiff(self.previous_frame, roi_gray)
+            thresh = cv2.threshold(frame_delta, self.threshold, 255, cv2.THRESH_BINARY)[1]
+        elif diff_threshold is not None:
+            # Fused Numba kernel: one pass instead of absdiff + threshold,
+            # and a free pixel count that skips dilation on still frames
+            thresh = self._thresh
+            if diff_threshold(self.previous_frame, roi_gray, self.threshold, thresh) == 0:
+                self._store_previous(roi_gray, roi_size)
+                return False, 0.0, np.empty((0, 5), dtype=np.int32), (x1, y1, x2, y2)
+        else:
+            frame_delta = cv2.absdiff(self.previous_frame, roi_gray, dst=self._delta)
+            thresh = cv2.threshold(
+                frame_delta, self.threshold, 255, cv2.THRESH_BINARY, dst=self._thresh
+            )[1]
         
         # Dilate to fill in holes
-        thresh = cv2.dilate(thresh, None, iterations=2)
-        
-        # Find contours
-        contours, _ = cv2.findContours(
-            thresh.copy(),
-            cv2.RETR_EXTERNAL,
-            cv2.CHAIN_APPROX_SIMPLE
-        )
+        # Contours and pixel counting run on the CPU
+        if self.use_opencl:
+            thresh = cv2.dilate(thresh, self._dilate_kernel).get()
+        else:
+            thresh = cv2.dilate(thresh, self._dilate_kernel, dst=self._mask)
         
         # Calculate motion percentage
-        motion_pixels = np.sum(thresh > 0)
-        total_pixels = thresh.shape[0] * thresh.shape[1]
+        motion_pixels = cv2.countNonZero(thresh)
+        total_pixels = thresh.size
         motion_percentage = motion_pixels / total_pixels if total_pixels > 0 else 0
         
-        # Check if significant motion detected
-        significant_motion = False
-        total_contour_area = 0
+        # Label connected components only when the pixel count can pass the
+        # sensitivity gate; on most frames it can't and labeling is skipped.
+        if motion_percentage >= self.sensitivity:
+            _, _, stats, _ = cv2.connectedComponentsWithStats(thresh, connectivity=8)
+            # Row 0 is the background component
+            stats = stats[1:]
+            stats = stats[stats[:, cv2.CC_STAT_AREA] >= self._scaled_min_area]
+        else:
+            stats = np.empty((0, 5), dtype=np.int32)
         
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area >= self.min_contour_area:
-                significant_motion = True
-                total_contour_area += area
+        # Check if significant motion detected
+        significant_motion = len(stats) > 0
+        total_contour_area = int(stats[:, cv2.CC_STAT_AREA].sum())
         
         # Motion is detected if percentage exceeds sensitivity threshold
         motion_detected = significant_motion and motion_percentage >= self.sensitivity
         
+        # Update previous frame
+        self._store_previous(roi_gray, roi_size)
+        
+        return motion_detected, motion_percentage, stats, (x1, y1, x2, y2)
+    
+    def _make_detect_fn(
+        self,
+        roi: Optional[Tuple[int, int, int, int]],
+        frame_shape: Tuple[int, ...],
+        preprocessed: bool = False
+    ) -> Callable[[np.ndarray], bool]:
+        """
+        Build a motion test specialized for one ROI and frame size.
+        
+        The ROI is normalized and the buffers are sized once; the returned
+        function keeps them, the settings and its reference frame in closure
+        locals, so per-frame calls skip those checks and attribute lookups.
+        It follows the same pipeline as _detect_motion_fast.
+        
+        Args:
+            roi: Region of interest as (x1, y1, x2, y2), or None for full frame
+            frame_shape: Shape of the video frames
+            preprocessed: The function is passed the grayscale ROI already
+                at detection scale (e.g. from RoiPipeCapture) instead of
+                full BGR frames; not supported on the OpenCL path
+            
+        Returns:
+            Function taking a frame and returning True if motion was detected
+        """
+        bounds = self._clamp_roi(roi, frame_shape)
+        if bounds is None:
+            return lambda frame: False
+        if self.use_opencl:
+            return lambda frame: self._detect_motion_fast(frame, roi)
+        
+        x1, y1, x2, y2 = bounds
+        crop_size = (x2 - x1, y2 - y1)
+        scale = self.scale
+        roi_size = self._detection_size(crop_size)
+        self._ensure_buffers(crop_size, roi_size)
+        
+        gray, small, delta, thresh, mask = (
+            self._gray, self._small, self._delta, self._thresh, self._mask
+        )
+        blur_out, prev = self._blur_out, self._prev
+        coarse, coarse_ref = self._coarse, self._coarse_ref
+        coarse_size = coarse.shape[::-1]
+        threshold = self.threshold
+        sensitivity = self.sensitivity
+        min_area = self._scaled_min_area
+        ksize = (self._blur_ksize, self._blur_ksize)
+        kernel = self._dilate_kernel
+        gate = self._tile_gate_block > 0
+        downscale = scale != 1.0 and not preprocessed
+        tile_gate_passes = self._tile_gate_passes
+        total_pixels = roi_size[0] * roi_size[1]
+        have_prev = False
+        
+        def detect(frame: np.ndarray) -> bool:
+            nonlocal blur_out, prev, coarse, coarse_ref, have_prev
+            
+            if preprocessed:
+                roi_gray = frame
+            else:
+                roi_gray = cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY, dst=gray)
+            if gate:
+                cv2.resize(roi_gray, coarse_size, dst=coarse, interpolation=cv2.INTER_AREA)
+                if have_prev and not tile_gate_passes(coarse, coarse_ref):
+                    return False
+            if downscale:
+                roi_gray = cv2.resize(roi_gray, roi_size, dst=small, interpolation=cv2.INTER_AREA)
+            roi_gray = cv2.GaussianBlur(roi_gray, ksize, 0, dst=blur_out)
+            
+            motion_detected = False
+            if have_prev:
+                if diff_threshold is not None:
+                    changed = diff_threshold(prev, roi_gray, threshold, thresh) > 0
+                else:
+                    cv2.absdiff(prev, roi_gray, dst=delta)
+                    cv2.threshold(delta, threshold, 255, cv2.THRESH_BINARY, dst=thresh)
+                    changed = True
+                if changed:
+                    cv2.dilate(thresh, kernel, dst=mask)
+                    if cv2.countNonZero(mask) / total_pixels >= sensitivity:
+                        stats = cv2.connectedComponentsWithStats(mask, connectivity=8)[2]
+                        motion_detected = bool((stats[1:, cv2.CC_STAT_AREA] >= min_area).any())
+            
+            # Keep this frame as the reference for the next one
+            blur_out, prev = prev, blur_out
+            coarse, coarse_ref = coarse_ref, coarse
+            have_prev = True
+            return motion_detected
+        
+        return detect
+    
+    def _detect_motion_fast(
+        self,
+        frame: np.ndarray,
+        roi: Optional[Tuple[int, int, int, int]] = None
+    ) -> bool:
+        """
+        Detect motion without building a visualization frame.
+        
+        Args:
+            frame: The current video frame
+            roi: Region of interest as (x1, y1, x2, y2), or None for full frame
+            
+        Returns:
+            True if motion was detected
+        """
+        return self._measure_motion(frame, roi)[0]
+    
+    def detect_motion(
+        self,
+        frame: np.ndarray,
+        roi: Optional[Tuple[int, int, int, int]] = None
+    ) -> Tuple[bool, float, np.ndarray]:
+        """
+        Detect motion in the frame within the specified region of interest.
+        
+        Args:
+            frame: The current video frame
+            roi: Region of interest as (x1, y1, x2, y2), or None for full frame
+            
+        Returns:
+            Tuple of (motion_detected, motion_percentage, visualization_frame)
+        """
+        motion_detected, motion_percentage, stats, bounds = self._measure_motion(frame, roi)
+        
         # Create visualization frame
         visualization = frame.copy()
+        if bounds is None:
+            return False, 0.0, visualization
+        x1, y1, x2, y2 = bounds
+        scale = self.scale
+        
+        # Nothing was compared yet: only outline the ROI
+        if stats is None:
+            if roi is not None:
+                cv2.rectangle(visualization, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            return False, 0.0, visualization
         
         # Draw ROI rectangle
         if roi is not None:
             color = (0, 0, 255) if motion_detected else (0, 255, 0)
             cv2.rectangle(visualization, (x1, y1), (x2, y2), color, 2)
             
-            # Draw contours within ROI
-            for contour in contours:
-                if cv2.contourArea(contour) >= self.min_contour_area:
-                    # Offset contour coordinates to frame coordinates
-                    contour_offset = contour + np.array([x1, y1])
-                    cv2.drawContours(visualization, [contour_offset], -1, (0, 255, 255), 2)
+            # Draw motion bounding boxes within ROI, mapped back to
+            # full-resolution frame coordinates
+            for left, top, width, height, _ in stats:
+                cv2.rectangle(
+                    visualization,
+                    (x1 + int(left / scale), y1 + int(top / scale)),
+                    (x1 + int((left + width) / scale), y1 + int((top + height) / scale)),
+                    (0, 255, 255),
+                    2
+                )
         
         # Add motion indicator text
         status = "MOTION DETECTED" if motion_detected else "No Motion"
@@ -158,19 +667,18 @@ class MotionDetector:
             2
         )
         
-        # Update previous frame
-        self.previous_frame = roi_gray.copy()
-        
         return motion_detected, motion_percentage, visualization
     
     def analyze_video_for_motion(
         self,
         video_path: str,
         roi: Tuple[int, int, int, int],
-        frame_skip: int = config.FRAME_SKIP,
+        frame_skip: Optional[int] = None,
         merge_gap_seconds: float = config.MERGE_GAP_SECONDS,
         progress_callback=None,
-        stop_check=None
+        stop_check=None,
+        ffmpeg_path: Optional[str] = None,
+        ffmpeg_threads: int = 0
     ) -> List[Tuple[int, int]]:
         """
         Analyze a video file and return frame ranges where motion is detected.
@@ -178,98 +686,219 @@ class MotionDetector:
         Args:
             video_path: Path to the video file
             roi: Region of interest as (x1, y1, x2, y2)
-            frame_skip: Process every Nth frame
+            frame_skip: Process every Nth frame; None uses the detector settings
             merge_gap_seconds: Gap threshold in seconds to merge motion segments
             progress_callback: Optional callback function(current_frame, total_frames)
             stop_check: Optional callable that returns True if processing should stop
+            ffmpeg_path: ffmpeg executable to decode only the ROI (see
+                iter_motion_ranges); None decodes with OpenCV
+            ffmpeg_threads: Thread count for that ffmpeg (0 = its default)
             
         Returns:
             List of tuples (start_frame, end_frame) where motion was detected
         """
+        return list(self.iter_motion_ranges(
+            video_path,
+            roi,
+            frame_skip=frame_skip,
+            merge_gap_seconds=merge_gap_seconds,
+            progress_callback=progress_callback,
+            stop_check=stop_check,
+            ffmpeg_path=ffmpeg_path,
+            ffmpeg_threads=ffmpeg_threads
+        ))
+    
+    def iter_motion_ranges(
+        self,
+        video_path: str,
+        roi: Tuple[int, int, int, int],
+        frame_skip: Optional[int] = None,
+        merge_gap_seconds: float = config.MERGE_GAP_SECONDS,
+        progress_callback=None,
+        stop_check=None,
+        ffmpeg_path: Optional[str] = None,
+        ffmpeg_threads: int = 0
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Analyze a video file, yielding motion ranges as soon as they are final.
+        
+        A range is yielded once the analysis is more than the merge gap past
+        its end, since no later motion can merge into it any more; the
+        ranges are the same as those of analyze_video_for_motion. Closing
+        the generator early stops the analysis.
+        
+        Args:
+            video_path: Path to the video file
+            roi: Region of interest as (x1, y1, x2, y2)
+            frame_skip: Process every Nth frame; None uses the detector settings
+            merge_gap_seconds: Gap threshold in seconds to merge motion segments
+            progress_callback: Optional callback function(current_frame, total_frames)
+            stop_check: Optional callable that returns True if processing should stop
+            ffmpeg_path: ffmpeg executable to decode only the ROI, cropped,
+                downscaled and converted to grayscale by ffmpeg; None (or a
+                failing ffmpeg) decodes full frames with OpenCV. Not used
+                with OpenCL.
+            ffmpeg_threads: Thread count for that ffmpeg (0 = its default)
+            
+        Yields:
+            Merged (start_frame, end_frame) tuples in frame order
+        """
         self.reset()
         
-        cap = cv2.VideoCapture(video_path)
+        if frame_skip is None:
+            frame_skip = self.frame_skip
+        
+        cap = open_capture(video_path, self.hw_acceleration)
         if not cap.isOpened():
             raise ValueError(f"Could not open video: {video_path}")
         
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         fps = cap.get(cv2.CAP_PROP_FPS)
-        
-        motion_ranges = []
+        gap_frames = int(merge_gap_seconds * fps)
+        
+        detect = None
+        if ffmpeg_path and not self.use_opencl:
+            frame_shape = (
+                int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            )
+            bounds = self._clamp_roi(roi, frame_shape)
+            if bounds is not None:
+                x1, y1, x2, y2 = bounds
+                pipe = RoiPipeCapture.open(
+                    ffmpeg_path, video_path, bounds,
+                    output_size=self._detection_size((x2 - x1, y2 - y1)),
+                    hw_acceleration=self.hw_acceleration,
+                    threads=ffmpeg_threads
+                )
+                if pipe is not None:
+                    cap.release()
+                    cap = pipe
+                    detect = self._make_detect_fn(roi, frame_shape, preprocessed=True)
+        
+        # Closed range that a motion starting within the gap still extends
+        pending = None
         current_motion_start = None
         frame_count = 0
+        last_progress = 0.0
+        
+        # Decode on a worker thread so decoding overlaps detection; the small
+        # queue keeps the decoder from running far ahead of the detector
+        frames = queue.Queue(maxsize=4)
+        stop_event = threading.Event()
+        decoder = threading.Thread(
+            target=self._decode_loop,
+            args=(cap, frames, frame_skip, stop_event, stop_check),
+            daemon=True
+        )
+        decoder.start()
         
-        while True:
-            # Check for stop request
-            if stop_check and stop_check():
-                break
-            
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # Process every Nth frame
-            if frame_count % frame_skip == 0:
-                motion_detected, _, _ = self.detect_motion(frame, roi)
+        try:
+            while True:
+                # Check for stop request
+                if stop_check and stop_check():
+                    break
+                
+                index, frame = frames.get()
+                if frame is None:
+                    frame_count = index
+                    break
+                
+                # The ROI is fixed for the whole video: specialize once
+                if detect is None:
+                    detect = self._make_detect_fn(roi, frame.shape)
+                motion_detected = detect(frame)
                 
                 if motion_detected:
                     if current_motion_start is None:
-                        current_motion_start = frame_count
+                        current_motion_start = index
                 else:
                     if current_motion_start is not None:
-                        motion_ranges.append((current_motion_start, frame_count - 1))
+                        # Merge nearby motion ranges using the configurable gap threshold
+                        if pending is not None and current_motion_start - pending[1] <= gap_frames:
+                            pending = (pending[0], index - 1)
+                        else:
+                            if pending is not None:
+                                yield pending
+                            pending = (current_motion_start, index - 1)
                         current_motion_start = None
-            
-            frame_count += 1
-            
-            if progress_callback:
-                progress_callback(frame_count, total_frames)
+                    elif pending is not None and index - pending[1] >= gap_frames:
+                        # Any later motion starts more than the gap after it
+                        yield pending
+                        pending = None
+                
+                frame_count = index + 1
+                
+                # Throttle progress updates; the final one is sent below
+                if progress_callback:
+                    now = time.monotonic()
+                    if now - last_progress >= config.PROGRESS_INTERVAL_SECONDS:
+                        progress_callback(frame_count, total_frames)
+                        last_progress = now
+        finally:
+            # Unblock a decoder waiting on a full queue, then wait for it
+            # before releasing the capture it reads from
+            stop_event.set()
+            while decoder.is_alive():
+                try:
+                    frames.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            decoder.join()
+            cap.release()
+        
+        if progress_callback:
+            progress_callback(frame_count, total_frames)
         
         # Don't forget to close the last motion range
         if current_motion_start is not None:
-            motion_ranges.append((current_motion_start, frame_count - 1))
-        
-        cap.release()
-        
-        # Merge nearby motion ranges using the configurable gap threshold
-        merged_ranges = self._merge_ranges(motion_ranges, fps, merge_gap_seconds)
-        
-        return merged_ranges
+            if pending is not None and current_motion_start - pending[1] <= gap_frames:
+                pending = (pending[0], frame_count - 1)
+            else:
+                if pending is not None:
+                    yield pending
+                pending = (current_motion_start, frame_count - 1)
+        if pending is not None:
+            yield pending
     
-    def _merge_ranges(
+    def _decode_loop(
         self,
-        ranges: List[Tuple[int, int]],
-        fps: float,
-        gap_threshold_seconds: float = 2.0
-    ) -> List[Tuple[int, int]]:
+        cap: cv2.VideoCapture,
+        frames: queue.Queue,
+        frame_skip: int,
+        stop_event: threading.Event,
+        stop_check=None
+    ):
         """
-        Merge motion ranges that are close together.
+        Decode a video and queue every Nth frame for detection.
+        
+        Runs on the decoder thread started by iter_motion_ranges.
+        Queues (frame_index, frame) tuples, followed by a final
+        (frames_decoded, None) once the video ends or a stop is requested.
         
         Args:
-            ranges: List of (start_frame, end_frame) tuples
-            fps: Frames per second of the video
-            gap_threshold_seconds: Maximum gap between ranges to merge
-            
-        Returns:
-            Merged list of ranges
+            cap: Opened capture to read from
+            frames: Bounded queue shared with the detection loop
+            frame_skip: Queue every Nth frame
+            stop_event: Set by the detection loop when it stops consuming
+            stop_check: Optional callable that returns True if processing should stop
         """
-        if not ranges:
-            return []
-        
-        gap_threshold_frames = int(gap_threshold_seconds * fps)
-        
-        # Sort by start frame
-        sorted_ranges = sorted(ranges, key=lambda x: x[0])
-        
-        merged = [sorted_ranges[0]]
-        
-        for start, end in sorted_ranges[1:]:
-            last_start, last_end = merged[-1]
-            
-            # If this range is close to the previous one, merge them
-            if start - last_end <= gap_threshold_frames:
-                merged[-1] = (last_start, max(last_end, end))
-            else:
-                merged.append((start, end))
-        
-        return merged
+        frame_count = 0
+        try:
+            while not stop_event.is_set():
+                if stop_check and stop_check():
+                    break
+                
+                # Skipped frames are only grabbed, which avoids the color
+                # conversion and frame copy of a full read
+                if frame_count % frame_skip == 0:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    frames.put((frame_count, frame))
+                elif not cap.grab():
+                    break
+                
+                frame_count += 1
+        finally:
+            frames.put((frame_count, None))
@@ -0,0 +1,75 @@
+"""
+Tests for decoding the ROI through ffmpeg (RoiPipeCapture).
+"""
+import os
+import shutil
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from detector_config import DetectorConfig
+from motion_detector import MotionDetector, RoiPipeCapture
+
+FFMPEG = shutil.which(config.FFMPEG_PATH) if config.FFMPEG_PATH else None
+
+pytestmark = pytest.mark.skipif(FFMPEG is None, reason="ffmpeg not found")
+
+FRAMES = 120
+WIDTH, HEIGHT = 320, 240
+# Odd size and odd offset, which crop rounds on subsampled input
+ROI = (41, 31, 250, 190)
+
+
+@pytest.fixture(scope="module")
+def video_path(tmp_path_factory):
+    """Write a clip with a square that moves during two separate intervals."""
+    path = str(tmp_path_factory.mktemp("video") / "motion.mp4")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), 15, (WIDTH, HEIGHT))
+    for i in range(FRAMES):
+        frame = np.full((HEIGHT, WIDTH, 3), 40, dtype=np.uint8)
+        if 20 <= i < 50:
+            x = 50 + (i - 20) * 5
+        elif 80 <= i < 100:
+            x = 200 - (i - 80) * 5
+        else:
+            x = 50 if i < 20 else (200 if i < 80 else 100)
+        cv2.rectangle(frame, (x, 80), (x + 40, 140), (255, 255, 255), -1)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def test_pipe_frames_match_roi_size(video_path):
+    x1, y1, x2, y2 = ROI
+    pipe = RoiPipeCapture.open(FFMPEG, video_path, ROI)
+    assert pipe is not None
+    try:
+        assert pipe.frame_shape == (y2 - y1, x2 - x1)
+        frames = 0
+        while True:
+            ret, frame = pipe.read()
+            if not ret:
+                break
+            assert frame.shape == (y2 - y1, x2 - x1)
+            frames += 1
+    finally:
+        pipe.release()
+    
+    assert frames == FRAMES
+
+
+def test_pipe_ranges_match_opencv_at_full_scale(video_path):
+    detector = MotionDetector(DetectorConfig.from_config(scale=1.0, frame_skip=1))
+    
+    with_pipe = detector.analyze_video_for_motion(
+        video_path, ROI, merge_gap_seconds=0, ffmpeg_path=FFMPEG
+    )
+    with_opencv = detector.analyze_video_for_motion(video_path, ROI, merge_gap_seconds=0)
+    
+    assert with_pipe
+    assert with_pipe == with_opencv
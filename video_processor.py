@@ -2,11 +2,30 @@
 Video processing module for extracting and exporting video clips with detected motion.
 """
 import cv2
+import numpy as np
 import os
-from typing import List, Tuple, Optional, Callable
+import shutil
+import subprocess
+import json
+import threading
+import multiprocessing
+import concurrent.futures
+import queue
+import time
+from collections import namedtuple
+from typing import Dict, List, Tuple, Optional, Callable
 from datetime import datetime
+from fractions import Fraction
 import config
-from motion_detector import MotionDetector
+from detector_config import DetectorConfig
+from motion_detector import MotionDetector, open_capture
+
+
+# Lowercase extensions of the video files picked up from the input folder
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv'})
+
+# A video found in the input folder, with the file name read at discovery
+VideoEntry = namedtuple('VideoEntry', 'path basename')
 
 
 class VideoProcessor:
@@ -18,7 +37,9 @@ class VideoProcessor:
         output_folder: str = config.OUTPUT_FOLDER,
         padding_before: float = config.PADDING_BEFORE_SECONDS,
         padding_after: float = config.PADDING_AFTER_SECONDS,
-        merge_gap: float = config.MERGE_GAP_SECONDS
+        merge_gap: float = config.MERGE_GAP_SECONDS,
+        detector_config: Optional[DetectorConfig] = None,
+        hw_accel: Optional[str] = config.EXPORT_HW_ACCEL
     ):
         """
         Initialize the video processor.
@@ -29,71 +50,230 @@ class VideoProcessor:
             padding_before: Seconds to include before motion
             padding_after: Seconds to include after motion
             merge_gap: Gap threshold in seconds to merge motion segments
+            detector_config: Motion detection settings; None uses the config.py defaults
+            hw_accel: GPU re-encode for clips that can't be stream-copied:
+                'auto' uses NVENC if ffmpeg has it, 'cuda' always tries it,
+                None never does
         """
         self.input_folder = input_folder
         self.output_folder = output_folder
         self.padding_before = padding_before
         self.padding_after = padding_after
         self.merge_gap = merge_gap
-        self.motion_detector = MotionDetector()
-        self._stop_requested = False
+        self.motion_detector = MotionDetector(detector_config)
+        self._ffmpeg = shutil.which(config.FFMPEG_PATH) if config.FFMPEG_PATH else None
+        self._ffprobe = shutil.which(config.FFPROBE_PATH) if config.FFPROBE_PATH else None
+        self.hw_accel = hw_accel
+        self._nvenc: Optional[bool] = None
+        # Thread count passed to ffmpeg (0 = its default); capped in worker processes
+        self.ffmpeg_threads = 0
+        # Decode buffers of the OpenCV export path, see _frame_pool()
+        self._pool: Optional[np.ndarray] = None
+        # Per-path metadata cache, see _cached_meta()
+        self._meta: Dict[str, dict] = {}
+        # A multiprocessing event while worker processes are running
+        self._stop_event = threading.Event()
         
         # Create output folder if it doesn't exist
         os.makedirs(self.output_folder, exist_ok=True)
     
     def request_stop(self):
         """Request to stop processing."""
-        self._stop_requested = True
+        self._stop_event.set()
     
     def is_stop_requested(self) -> bool:
         """Check if stop has been requested."""
-        return self._stop_requested
+        return self._stop_event.is_set()
     
     def get_video_files(self) -> List[str]:
         """
-        Get all MP4 video files in the input folder.
+        Get all video files in the input folder.
         
         Returns:
             List of full paths to video files
         """
-        if not os.path.exists(self.input_folder):
+        return [video.path for video in self.get_video_entries()]
+    
+    def get_video_entries(self) -> List[VideoEntry]:
+        """
+        Get all video files in the input folder with their names.
+        
+        Returns:
+            List of VideoEntry tuples, sorted by path
+        """
+        videos = []
+        try:
+            with os.scandir(self.input_folder) as entries:
+                for entry in entries:
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in VIDEO_EXTENSIONS and entry.is_file():
+                        videos.append(VideoEntry(entry.path, entry.name))
+        except FileNotFoundError:
             return []
         
-        video_extensions = ('.mp4', '.MP4', '.avi', '.AVI', '.mov', '.MOV', '.mkv', '.MKV')
-        video_files = []
+        videos.sort()
+        return videos
+    
+    def _cached_meta(self, video_path: str) -> dict:
+        """
+        Get the metadata cache entry of a video file.
         
-        for filename in os.listdir(self.input_folder):
-            if filename.endswith(video_extensions):
-                video_files.append(os.path.join(self.input_folder, filename))
+        The entry is dropped and started over when the file's modification
+        time changes, e.g. when a recording is still being written.
         
-        return sorted(video_files)
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            Mutable cache entry; empty if nothing is cached yet. A file that
+            can't be stat()ed gets a throwaway entry.
+        """
+        try:
+            mtime = os.stat(video_path).st_mtime_ns
+        except OSError:
+            return {}
+        
+        meta = self._meta.get(video_path)
+        if meta is None or meta['mtime_ns'] != mtime:
+            meta = self._meta[video_path] = {'mtime_ns': mtime}
+        return meta
     
     def get_video_info(self, video_path: str) -> dict:
         """
         Get information about a video file.
         
+        Reads the container metadata with ffprobe when it is available, so
+        no frames are decoded; otherwise falls back to OpenCV. The result is
+        cached until the file changes.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            Dictionary with video information
+        """
+        meta = self._cached_meta(video_path)
+        if 'info' not in meta:
+            meta['info'] = self._read_video_info(video_path)
+        return dict(meta['info'])
+    
+    def _read_video_info(self, video_path: str) -> dict:
+        """
+        Read information about a video file, without the cache.
+        
         Args:
             video_path: Path to the video file
             
         Returns:
             Dictionary with video information
         """
-        cap = cv2.VideoCapture(video_path)
+        info = self._probe_video_info(video_path)
+        if info is not None:
+            return info
+        
+        cap = open_capture(video_path, hw_acceleration=False)
+        try:
+            if not cap.isOpened():
+                raise ValueError(f"Could not open video: {video_path}")
+            
+            info = {
+                'path': video_path,
+                'filename': os.path.basename(video_path),
+                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                'fps': cap.get(cv2.CAP_PROP_FPS),
+                'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+                'duration': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) / cap.get(cv2.CAP_PROP_FPS)
+            }
+        finally:
+            cap.release()
+        
+        return info
+    
+    def _probe_video_info(self, video_path: str) -> Optional[dict]:
+        """
+        Read video information from the container with ffprobe.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            Dictionary with video information, or None if ffprobe is not
+            available or could not read the stream
+        """
+        if not self._ffprobe:
+            return None
+        
+        command = [
+            self._ffprobe, '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'stream=width,height,r_frame_rate,nb_frames,duration:format=duration',
+            '-of', 'json',
+            video_path
+        ]
+        try:
+            result = subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            if result.returncode != 0:
+                return None
+            
+            probe = json.loads(result.stdout)
+            stream = probe['streams'][0]
+            fps = float(Fraction(stream['r_frame_rate']))
+            duration = float(stream.get('duration') or probe['format']['duration'])
+            # Not every container stores a frame count (e.g. MKV)
+            if stream.get('nb_frames'):
+                frame_count = int(stream['nb_frames'])
+            else:
+                frame_count = int(round(duration * fps))
+            
+            return {
+                'path': video_path,
+                'filename': os.path.basename(video_path),
+                'width': int(stream['width']),
+                'height': int(stream['height']),
+                'fps': fps,
+                'frame_count': frame_count,
+                'duration': duration
+            }
+        except (OSError, ValueError, KeyError, IndexError, ZeroDivisionError):
+            return None
+    
+    def _open_video(self, video_path: str) -> tuple:
+        """
+        Open a video for export along with its stream properties.
+        
+        The properties are read from the capture the first time and then
+        cached until the file changes, so repeated exports from the same
+        video skip the backend queries.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            Tuple of (capture, fps, width, height, total_frames); the caller
+            must release the capture
+        """
+        cap = open_capture(video_path, hw_acceleration=False)
         if not cap.isOpened():
             raise ValueError(f"Could not open video: {video_path}")
         
-        info = {
-            'path': video_path,
-            'filename': os.path.basename(video_path),
-            'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-            'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-            'fps': cap.get(cv2.CAP_PROP_FPS),
-            'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-            'duration': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) / cap.get(cv2.CAP_PROP_FPS)
-        }
+        meta = self._cached_meta(video_path)
+        if 'stream' not in meta:
+            meta['stream'] = (
+                cap.get(cv2.CAP_PROP_FPS),
+                int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            )
+        fps, width, height, total_frames = meta['stream']
         
-        cap.release()
-        return info
+        return cap, fps, width, height, total_frames
     
     def export_clip(
         self,
@@ -116,59 +296,338 @@ class VideoProcessor:
         Returns:
             Path to the exported clip
         """
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            raise ValueError(f"Could not open video: {video_path}")
+        cap, fps, width, height, total_frames = self._open_video(video_path)
+        try:
+            first_frame, last_frame = self._pad_range(
+                start_frame, end_frame, self._padding_frames(fps), total_frames
+            )
+            self._check_free_space(video_path, last_frame - first_frame + 1, total_frames)
+            return self._export_clip(
+                cap, video_path, fps, width, height,
+                first_frame, last_frame, output_name, progress_callback
+            )
+        finally:
+            cap.release()
+            self._pool = None
+    
+    def _frame_pool(self, width: int, height: int, frames: int) -> np.ndarray:
+        """
+        Get the decode buffers for re-encoding a clip with OpenCV.
         
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        The buffers are one 4-D allocation of at most EXPORT_FRAME_BUFFERS
+        frames, kept between the clips of a video and only reallocated when
+        a clip needs more frames or the frame size differs. Callers drop
+        it (self._pool = None) once the video is done.
+        
+        Args:
+            width: Frame width of the source
+            height: Frame height of the source
+            frames: Number of frames in the clip
+            
+        Returns:
+            Array of shape (n, height, width, 3) with n = min(frames, EXPORT_FRAME_BUFFERS)
+        """
+        count = max(1, min(frames, config.EXPORT_FRAME_BUFFERS))
+        pool = self._pool
+        if pool is None or pool.shape[1:] != (height, width, 3) or len(pool) < count:
+            pool = self._pool = np.empty((count, height, width, 3), dtype=np.uint8)
+        return pool[:count]
+    
+    def _check_free_space(self, video_path: str, frames: int, total_frames: int):
+        """
+        Make sure the output folder has room for a clip before exporting it.
         
-        # Apply padding
-        padding_frames_before = int(self.padding_before * fps)
-        padding_frames_after = int(self.padding_after * fps)
+        The clip size is estimated from the source's average bytes per
+        frame, so a full disk fails up front instead of leaving a truncated
+        clip behind after a long encode.
         
-        actual_start = max(0, start_frame - padding_frames_before)
-        actual_end = min(total_frames - 1, end_frame + padding_frames_after)
+        Args:
+            video_path: Path to the source video
+            frames: Number of frames in the clip
+            total_frames: Frame count of the source
+            
+        Raises:
+            OSError: If less than FREE_SPACE_MARGIN times the estimate is free
+        """
+        if config.FREE_SPACE_MARGIN <= 0 or total_frames <= 0:
+            return
+        
+        estimate = os.path.getsize(video_path) * frames / total_frames
+        free = shutil.disk_usage(self.output_folder).free
+        if free < estimate * config.FREE_SPACE_MARGIN:
+            raise OSError(
+                f"Not enough free space in {self.output_folder}: "
+                f"{free / 1e6:.0f} MB free, clip needs about {estimate / 1e6:.0f} MB"
+            )
+    
+    def _padding_frames(self, fps: float) -> Tuple[int, int]:
+        """
+        Convert the padding settings to frame counts.
+        
+        Args:
+            fps: Frames per second of the source
+            
+        Returns:
+            Tuple of (frames_before, frames_after)
+        """
+        return int(self.padding_before * fps), int(self.padding_after * fps)
+    
+    @staticmethod
+    def _pad_range(
+        start_frame: int,
+        end_frame: int,
+        padding_frames: Tuple[int, int],
+        total_frames: int
+    ) -> Tuple[int, int]:
+        """
+        Apply padding to a motion range and clamp it to the video.
+        
+        Args:
+            start_frame: Starting frame number of the motion
+            end_frame: Ending frame number of the motion
+            padding_frames: (frames_before, frames_after) from _padding_frames
+            total_frames: Frame count of the source
+            
+        Returns:
+            Tuple of (first_frame, last_frame) of the clip
+        """
+        return (
+            max(0, start_frame - padding_frames[0]),
+            min(total_frames - 1, end_frame + padding_frames[1])
+        )
+    
+    def _export_clip(
+        self,
+        cap: cv2.VideoCapture,
+        video_path: str,
+        fps: float,
+        width: int,
+        height: int,
+        first_frame: int,
+        last_frame: int,
+        output_name: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """
+        Export a padded frame range using an already open capture of the source video.
+        
+        The capture is left open and positioned after the clip, so clips of
+        one video can be exported in order without reopening it.
+        
+        Args:
+            cap: Open capture of the source video
+            video_path: Path to the source video
+            fps: Frames per second of the source
+            width: Frame width of the source
+            height: Frame height of the source
+            first_frame: First frame of the clip, padding already applied
+            last_frame: Last frame of the clip, padding already applied
+            output_name: Optional custom output filename
+            progress_callback: Optional callback function(current_frame, total_frames)
+            
+        Returns:
+            Path to the exported clip
+        """
+        frames_to_write = last_frame - first_frame + 1
+        start_time = first_frame / fps
         
         # Generate output filename
         if output_name is None:
             base_name = os.path.splitext(os.path.basename(video_path))[0]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            start_time = actual_start / fps
-            end_time = actual_end / fps
+            end_time = last_frame / fps
             output_name = f"{base_name}_motion_{start_time:.1f}s-{end_time:.1f}s_{timestamp}.mp4"
         
         output_path = os.path.join(self.output_folder, output_name)
         
+        # Fast path: let ffmpeg cut the range and copy the streams as-is,
+        # and, failing that, re-encode on the GPU where NVENC is available,
+        # or with libx264 from the decoder's native YUV frames
+        duration = frames_to_write / fps
+        if self._ffmpeg and (
+            self._export_clip_ffmpeg(video_path, output_path, start_time, duration)
+            or (
+                self._nvenc_available()
+                and self._export_clip_ffmpeg(
+                    video_path, output_path, start_time, duration, encoder='h264_nvenc'
+                )
+            )
+            or self._export_clip_ffmpeg(
+                video_path, output_path, start_time, duration, encoder='libx264'
+            )
+        ):
+            if progress_callback:
+                progress_callback(frames_to_write, frames_to_write)
+            return output_path
+        
         # Set up video writer
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
         
-        # Seek to start frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, actual_start)
+        # Seek to start frame. A start shortly ahead of the current position
+        # is reached by grabbing, which skips the BGR conversion and avoids
+        # a seek; other starts use a (keyframe-based) seek.
+        frames_ahead = first_frame - int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if 0 <= frames_ahead <= config.SEEK_GRAB_FRAMES:
+            for _ in range(frames_ahead):
+                if not cap.grab():
+                    break
+        else:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, first_frame)
         
-        # Write frames
-        frames_to_write = actual_end - actual_start + 1
+        # Write frames. Decoding stays on this thread and encoding runs on a
+        # writer thread; both release the GIL inside OpenCV, so they overlap.
+        # Frames are decoded into a fixed pool of buffers that the writer
+        # hands back once written, so nothing is allocated per frame and at
+        # most EXPORT_FRAME_BUFFERS frames are in flight. The pool is reused
+        # across the clips of a video, sliced into per-frame views.
+        free_buffers = queue.Queue()
+        for buffer in self._frame_pool(width, height, frames_to_write):
+            free_buffers.put(buffer)
+        frames = queue.Queue()
+        write_error = None
+        
+        def write_frames():
+            # After a failed write the remaining frames are only drained, so
+            # every buffer still goes back and the decoder never blocks
+            nonlocal write_error
+            frame = frames.get()
+            while frame is not None:
+                if write_error is None:
+                    try:
+                        writer.write(frame)
+                    except Exception as e:
+                        write_error = e
+                free_buffers.put(frame)
+                frame = frames.get()
+        
+        writer_thread = threading.Thread(target=write_frames, daemon=True)
+        writer_thread.start()
         frames_written = 0
+        last_progress = 0.0
         
-        while frames_written < frames_to_write:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            writer.write(frame)
-            frames_written += 1
-            
-            if progress_callback:
-                progress_callback(frames_written, frames_to_write)
+        try:
+            while frames_written < frames_to_write and write_error is None:
+                ret, frame = cap.read(free_buffers.get())
+                if not ret:
+                    break
+                
+                frames.put(frame)
+                frames_written += 1
+                
+                # Throttle progress updates; the final one is sent below
+                if progress_callback:
+                    now = time.monotonic()
+                    if now - last_progress >= config.PROGRESS_INTERVAL_SECONDS:
+                        progress_callback(frames_written, frames_to_write)
+                        last_progress = now
+        finally:
+            frames.put(None)
+            writer_thread.join()
+            writer.release()
+        
+        if write_error is not None:
+            raise write_error
         
-        cap.release()
-        writer.release()
+        if progress_callback:
+            progress_callback(frames_written, frames_to_write)
         
         return output_path
     
+    def _nvenc_available(self) -> bool:
+        """
+        Check whether clips may be re-encoded with NVENC.
+        
+        Returns:
+            True if hw_accel allows it and ffmpeg lists the h264_nvenc
+            encoder (probed once per processor)
+        """
+        if not self._ffmpeg or self.hw_accel is None:
+            return False
+        if self.hw_accel == 'cuda':
+            return True
+        
+        if self._nvenc is None:
+            try:
+                result = subprocess.run(
+                    [self._ffmpeg, '-hide_banner', '-encoders'],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True
+                )
+                self._nvenc = result.returncode == 0 and 'h264_nvenc' in result.stdout
+            except OSError:
+                self._nvenc = False
+        
+        return self._nvenc
+    
+    def _export_clip_ffmpeg(
+        self,
+        video_path: str,
+        output_path: str,
+        start_time: float,
+        duration: float,
+        encoder: Optional[str] = None
+    ) -> bool:
+        """
+        Export a clip with ffmpeg.
+        
+        Without an encoder the streams are copied, with no decoding or
+        re-encoding; the clip then starts on the keyframe at or before
+        start_time, so it can begin slightly before the requested padding.
+        With encoder='h264_nvenc', decoding (NVDEC, picked by -hwaccel
+        cuda) and encoding both stay on the GPU. With encoder='libx264',
+        frames go from the decoder to the encoder as yuv420p, with no
+        round trip through BGR as in the OpenCV fallback.
+        
+        Args:
+            video_path: Path to the source video
+            output_path: Path of the clip to write
+            start_time: Start of the clip in seconds
+            duration: Length of the clip in seconds
+            encoder: Video encoder to re-encode with, or None to stream copy
+            
+        Returns:
+            True if ffmpeg wrote the clip, False to fall back
+        """
+        if encoder == 'h264_nvenc':
+            input_args = ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+            codec_args = ['-c:v', encoder, '-preset', 'p1', '-c:a', 'aac']
+        elif encoder == 'libx264':
+            input_args = []
+            codec_args = [
+                '-c:v', encoder, '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', '-c:a', 'aac'
+            ]
+        else:
+            input_args = []
+            codec_args = ['-c', 'copy']
+        
+        thread_args = ['-threads', str(self.ffmpeg_threads)] if self.ffmpeg_threads else []
+        command = [
+            self._ffmpeg, '-hide_banner', '-loglevel', 'error', '-y',
+            *input_args,
+            *thread_args,
+            '-ss', f"{start_time:.3f}",
+            '-i', video_path,
+            '-t', f"{duration:.3f}",
+            *codec_args,
+            *thread_args,
+            '-avoid_negative_ts', 'make_zero',
+            output_path
+        ]
+        try:
+            result = subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return False
+        
+        return result.returncode == 0 and os.path.isfile(output_path) and os.path.getsize(output_path) > 0
+    
     def process_video(
         self,
         video_path: str,
@@ -189,9 +648,17 @@ class VideoProcessor:
         exported_clips = []
         
         # Check for stop request
-        if self._stop_requested:
+        if self.is_stop_requested():
             return []
         
+        # Set by the first export that fails. A full disk or a broken ffmpeg
+        # would fail every later clip too, so the analysis stops and no
+        # further clips are queued.
+        export_failed = threading.Event()
+        
+        def stop_check():
+            return self.is_stop_requested() or export_failed.is_set()
+        
         # Analyze video for motion
         if progress_callback:
             progress_callback("Analyzing video for motion...", 0, 100)
@@ -204,47 +671,105 @@ class VideoProcessor:
                     100
                 )
             # Return True to signal stop
-            return self._stop_requested
+            return stop_check()
         
-        motion_ranges = self.motion_detector.analyze_video_for_motion(
+        # Ranges closer than the padding would give clips with overlapping
+        # windows, exporting the same frames twice: merge them instead.
+        # int() of the summed padding is never below the sum of the
+        # per-side frame counts used by _padding_frames.
+        merge_gap = max(self.merge_gap, self.padding_before + self.padding_after)
+        motion_ranges = self.motion_detector.iter_motion_ranges(
             video_path,
             roi,
-            merge_gap_seconds=self.merge_gap,
+            merge_gap_seconds=merge_gap,
             progress_callback=analysis_progress,
-            stop_check=self.is_stop_requested
+            stop_check=stop_check,
+            ffmpeg_path=self._ffmpeg,
+            ffmpeg_threads=self.ffmpeg_threads
         )
         
-        # Check for stop request
-        if self._stop_requested:
-            return []
-        
-        if not motion_ranges:
-            if progress_callback:
-                progress_callback("No motion detected", 100, 100)
-            return []
+        # Export each range as soon as the analysis has finalized it, so
+        # exporting overlaps the rest of the analysis. A single worker
+        # exports the clips in order, sharing one open capture.
+        cap = None
+        futures = []
         
-        # Export clips for each motion range
-        total_clips = len(motion_ranges)
-        for i, (start_frame, end_frame) in enumerate(motion_ranges):
+        def export(first_frame, last_frame):
             # Check for stop request
-            if self._stop_requested:
-                return exported_clips
-            
-            if progress_callback:
-                progress_callback(
-                    f"Exporting clip {i+1}/{total_clips}",
-                    50 + int((i + 1) * 50 / total_clips),
-                    100
+            if stop_check():
+                return None
+            try:
+                self._check_free_space(video_path, last_frame - first_frame + 1, total_frames)
+                return self._export_clip(
+                    cap, video_path, fps, width, height, first_frame, last_frame
                 )
+            except Exception:
+                export_failed.set()
+                raise
+        
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            for start_frame, end_frame in motion_ranges:
+                if export_failed.is_set():
+                    break
+                if cap is None:
+                    cap, fps, width, height, total_frames = self._open_video(video_path)
+                    # The padding is the same for every clip of the video
+                    padding_frames = self._padding_frames(fps)
+                first_frame, last_frame = self._pad_range(
+                    start_frame, end_frame, padding_frames, total_frames
+                )
+                futures.append(executor.submit(export, first_frame, last_frame))
+            
+            if not futures:
+                if progress_callback and not self.is_stop_requested():
+                    progress_callback("No motion detected", 100, 100)
+                return []
             
-            clip_path = self.export_clip(video_path, start_frame, end_frame)
-            exported_clips.append(clip_path)
+            total_clips = len(futures)
+            for i, future in enumerate(futures):
+                if progress_callback:
+                    progress_callback(
+                        f"Exporting clip {i+1}/{total_clips}",
+                        50 + int((i + 1) * 50 / total_clips),
+                        100
+                    )
+                
+                if self.is_stop_requested():
+                    return exported_clips
+                clip_path = future.result()
+                if clip_path is None:
+                    return exported_clips
+                exported_clips.append(clip_path)
+        finally:
+            motion_ranges.close()
+            executor.shutdown(wait=True, cancel_futures=True)
+            if cap is not None:
+                cap.release()
+            self._pool = None
         
         if progress_callback:
             progress_callback(f"Exported {len(exported_clips)} clips", 100, 100)
         
         return exported_clips
     
+    def _settings(self) -> dict:
+        """
+        Get the constructor arguments that recreate this processor.
+        
+        Returns:
+            Keyword arguments for VideoProcessor
+        """
+        return {
+            'input_folder': self.input_folder,
+            'output_folder': self.output_folder,
+            'padding_before': self.padding_before,
+            'padding_after': self.padding_after,
+            'merge_gap': self.merge_gap,
+            'detector_config': self.motion_detector.detector_config,
+            'hw_accel': self.hw_accel
+        }
+    
     def process_all_videos(
         self,
         roi: Tuple[int, int, int, int],
@@ -253,6 +778,9 @@ class VideoProcessor:
         """
         Process all video files in the input folder.
         
+        Videos are independent, so with several videos and CPU cores they
+        are processed in parallel worker processes.
+        
         Args:
             roi: Region of interest as (x1, y1, x2, y2)
             progress_callback: Optional callback(status, video_index, total_videos, video_name)
@@ -260,20 +788,24 @@ class VideoProcessor:
         Returns:
             Dictionary mapping video paths to lists of exported clip paths
         """
-        video_files = self.get_video_files()
+        videos = self.get_video_entries()
         
-        if not video_files:
+        if not videos:
             return {}
         
+        max_workers = min(len(videos), _available_cpus())
+        if max_workers > 1:
+            return self._process_videos_parallel(videos, roi, progress_callback, max_workers)
+        
         results = {}
-        total_videos = len(video_files)
+        total_videos = len(videos)
         
-        for i, video_path in enumerate(video_files):
+        for i, video in enumerate(videos):
             # Check for stop request
-            if self._stop_requested:
+            if self.is_stop_requested():
                 break
             
-            video_name = os.path.basename(video_path)
+            video_path, video_name = video.path, video.basename
             
             if progress_callback:
                 progress_callback(
@@ -296,28 +828,206 @@ class VideoProcessor:
                 results[video_path] = []
         
         return results
+    
+    def _process_videos_parallel(
+        self,
+        videos: List[VideoEntry],
+        roi: Tuple[int, int, int, int],
+        progress_callback: Optional[Callable[[str, int, int, str], None]],
+        max_workers: int
+    ) -> dict:
+        """
+        Process videos in a pool of worker processes.
+        
+        Each worker builds its own VideoProcessor, since captures and the
+        stop event don't pickle. Workers are spawned rather than forked, as
+        the caller (e.g. the GUI) runs other threads that a fork could
+        catch holding a lock. The CPUs are split between the workers, so
+        the OpenCV, Numba and ffmpeg threads of each stay within its share.
+        
+        Progress comes back over a queue and is passed to progress_callback
+        on the calling thread, with the number of finished videos as the
+        index so the overall progress only moves forward; request_stop()
+        reaches the workers through a shared event.
+        
+        Args:
+            videos: The videos to process
+            roi: Region of interest as (x1, y1, x2, y2)
+            progress_callback: Optional callback(status, video_index, total_videos, video_name)
+            max_workers: Number of worker processes
+            
+        Returns:
+            Dictionary mapping video paths to lists of exported clip paths
+        """
+        context = multiprocessing.get_context('spawn')
+        stop_event = context.Event()
+        if self.is_stop_requested():
+            stop_event.set()
+        self._stop_event = stop_event
+        progress_queue = context.Queue()
+        total_videos = len(videos)
+        settings = self._settings()
+        threads = max(1, _available_cpus() // max_workers)
+        results = {}
+        
+        last_update = None
+        last_finished = 0
+        
+        def forward_progress():
+            # Forward only the latest status, and only when there is a new
+            # one or another video has finished
+            nonlocal last_update, last_finished
+            update = None
+            while True:
+                try:
+                    update = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+            finished = len(results)
+            if update is None and finished == last_finished:
+                return
+            last_update = update or last_update
+            last_finished = finished
+            if last_update is not None and progress_callback:
+                status, index, video_name = last_update
+                progress_callback(status, finished, total_videos, video_name)
+        
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(stop_event, progress_queue, threads)
+        ) as executor:
+            futures = {
+                executor.submit(_process_one, video, i, total_videos, roi, settings): video.path
+                for i, video in enumerate(videos)
+            }
+            pending = set(futures)
+            
+            while pending:
+                done, pending = concurrent.futures.wait(pending, timeout=0.1)
+                
+                # Videos that haven't started yet are dropped on stop, and
+                # no more are handed to the workers
+                if self.is_stop_requested():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    video_path = futures[future]
+                    try:
+                        results[video_path] = future.result()
+                    except Exception as e:
+                        print(f"Error processing {video_path}: {e}")
+                        results[video_path] = []
+                
+                forward_progress()
+        
+        forward_progress()
+        
+        # Report results in input order, like the sequential loop
+        return {video.path: results[video.path] for video in videos if video.path in results}
+
+
+_worker_stop_event = None
+_worker_progress_queue = None
+_worker_threads = 0
+
 
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
 
-def get_first_frame(video_path: str) -> Optional[tuple]:
+
+def _init_worker(stop_event, progress_queue, threads: int):
     """
-    Get the first frame of a video.
+    Set up a worker process started by _process_videos_parallel.
+    
+    Keeps the shared stop event and progress queue, and limits the
+    OpenCV, Numba and ffmpeg thread pools of this worker to its share of
+    the CPUs.
     
     Args:
-        video_path: Path to the video file
+        stop_event: Shared stop event
+        progress_queue: Queue that progress updates are sent to
+        threads: Threads this worker may use
+    """
+    global _worker_stop_event, _worker_progress_queue, _worker_threads
+    _worker_stop_event = stop_event
+    _worker_progress_queue = progress_queue
+    _worker_threads = threads
+    
+    cv2.setNumThreads(threads)
+    try:
+        import numba
+        numba.set_num_threads(min(threads, numba.config.NUMBA_NUM_THREADS))
+    except ImportError:
+        pass
+
+
+def _process_one(
+    video: VideoEntry,
+    index: int,
+    total_videos: int,
+    roi: Tuple[int, int, int, int],
+    settings: dict
+) -> List[str]:
+    """
+    Process one video in a worker process started by process_all_videos.
+    
+    Args:
+        video: The video to process
+        index: Position of the video in the input list
+        total_videos: Number of videos being processed
+        roi: Region of interest as (x1, y1, x2, y2)
+        settings: VideoProcessor keyword arguments
         
     Returns:
-        Tuple of (frame, width, height) or None if failed
+        List of paths to exported clips
     """
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        return None
+    processor = VideoProcessor(**settings)
+    processor._stop_event = _worker_stop_event
+    processor.ffmpeg_threads = _worker_threads
+    
+    def video_progress(status, current, total):
+        _worker_progress_queue.put((status, index, video.basename))
+    
+    video_progress(f"Processing video {index+1}/{total_videos}", 0, 0)
+    return processor.process_video(video.path, roi, video_progress)
+
+
+def open_preview_capture(video_path: str) -> Optional[tuple]:
+    """
+    Open a video and read its first frame, keeping the capture open.
+    
+    The caller owns the returned capture and must release it. Keeping it
+    open lets later frame reads and seeks reuse it instead of re-opening
+    and re-parsing the container.
     
-    ret, frame = cap.read()
-    if not ret:
-        cap.release()
-        return None
+    Args:
+        video_path: Path to the video file
+        
+    Returns:
+        Tuple of (capture, frame, width, height) or None if failed
+    """
+    cap = open_capture(video_path, hw_acceleration=False)
+    keep_open = False
+    try:
+        if not cap.isOpened() or not cap.grab():
+            return None
+        
+        ret, frame = cap.retrieve()
+        if not ret:
+            return None
+        keep_open = True
+    finally:
+        if not keep_open:
+            cap.release()
     
     height, width = frame.shape[:2]
-    cap.release()
     
-    return frame, width, height
+    return cap, frame, width, height